@@ -0,0 +1,276 @@
+# cache.py
+"""
+도구 결과 캐시 유틸리티
+프로세스 내 TTLCache(L1) + Redis 공유 캐시 / 디스크 캐시(L2, 선택) 구성
+"""
+import os
+import zlib
+import asyncio
+import hashlib
+import logging
+import functools
+import orjson
+from typing import Any, Callable, Dict, MutableMapping, Optional, Tuple
+from cachetools import TTLCache
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis는 선택 의존성
+    aioredis = None
+
+try:
+    import diskcache
+except ImportError:  # diskcache는 선택 의존성
+    diskcache = None
+
+logger = logging.getLogger("law-mcp")
+
+# 공유 캐시 기본 TTL (24시간, L1과 동일)
+SHARED_CACHE_TTL = 86400
+
+# Redis 클라이언트 (REDIS_URL 미설정 시 None → L1만 사용)
+_redis = None
+
+# L2 저장 시 압축 레벨 (zlib, 속도 우선)
+COMPRESS_LEVEL = 3
+
+# 디스크 캐시 최대 크기 (512MB)
+DISK_CACHE_SIZE_LIMIT = 512 * 1024 * 1024
+
+# 디스크 캐시 (CACHE_DIR 미설정 시 None → 재시작 시 캐시 초기화)
+_disk = None
+
+def make_ttl_cache(maxsize: int, ttl: float, getsizeof: Optional[Callable[[Any], int]] = None) -> MutableMapping:
+    """
+    TTL 캐시를 생성합니다.
+    가득 차면 가장 오래 사용되지 않은 항목(LRU)부터 제거하는 cachetools.TTLCache를 사용합니다.
+    (cachebox.TTLCache는 삽입 순서(FIFO)로 제거하여 자주 조회되는 키가 밀려나므로 사용하지 않음)
+
+    Args:
+        maxsize: 최대 항목 수
+        ttl: 항목 유지 시간 (초)
+        getsizeof: 항목 크기 함수 (지정 시 maxsize는 항목 크기의 합계 상한, 예: 바이트)
+    """
+    return TTLCache(maxsize=maxsize, ttl=ttl, getsizeof=getsizeof)
+
+
+def has_error(result: dict) -> bool:
+    """결과 또는 그 하위 결과(search_all의 대상별 결과, 일괄 조회의 항목별 결과 등)에 오류가 있는지 확인"""
+    if "error" in result:
+        return True
+    for value in result.values():
+        if isinstance(value, dict) and "error" in value:
+            return True
+        if isinstance(value, list) and any(isinstance(item, dict) and "error" in item for item in value):
+            return True
+    return False
+
+
+# 실패 캐시 TTL (초): 일시적 오류는 금방 다시 시도, 영구 오류(4xx)는 오래 유지
+TRANSIENT_FAILURE_TTL = 60
+PERMANENT_FAILURE_TTL = 3600
+FAILURE_CACHE_MAXSIZE = 200
+
+
+class CacheMux:
+    """
+    한 도구의 성공 캐시(L1) / 실패 캐시 / 진행 중인 조회를 묶어 한 번에 조회합니다.
+    실패는 일시적 오류와 영구 오류로 나누어 서로 다른 TTL로 보관합니다.
+    """
+
+    def __init__(self, cache: MutableMapping):
+        """
+        Args:
+            cache: 성공 결과 캐시 (TTLCache 등, 여러 CacheMux가 공유해도 됨)
+        """
+        self.cache = cache
+        self.transient = make_ttl_cache(FAILURE_CACHE_MAXSIZE, TRANSIENT_FAILURE_TTL)
+        self.permanent = make_ttl_cache(FAILURE_CACHE_MAXSIZE, PERMANENT_FAILURE_TTL)
+        # 진행 중인 조회 (같은 키의 동시 요청은 하나의 upstream 호출을 공유)
+        self.inflight: Dict[tuple, asyncio.Task] = {}
+
+    def lookup(self, key: tuple) -> Tuple[str, Any]:
+        """
+        성공 → 실패 → 진행 중 순서로 확인합니다.
+
+        Returns:
+            ("hit", 결과) / ("neg", 오류 결과) / ("inflight", Task) / ("miss", None)
+        """
+        value = self.cache.get(key)
+        if value is not None:
+            return "hit", value
+        value = self.permanent.get(key) or self.transient.get(key)
+        if value is not None:
+            return "neg", value
+        task = self.inflight.get(key)
+        if task is not None:
+            return "inflight", task
+        return "miss", None
+
+    def record_success(self, key: tuple, value: Any) -> None:
+        """성공 결과를 캐시에 저장합니다."""
+        self.cache[key] = value
+
+    def record_failure(self, key: tuple, value: Any, permanent: bool = False) -> None:
+        """오류 결과를 실패 캐시에 저장합니다."""
+        (self.permanent if permanent else self.transient)[key] = value
+
+    def has_failure(self, key: tuple) -> bool:
+        """실패 캐시에 기록된 오류가 있는지 확인합니다."""
+        return key in self.permanent or key in self.transient
+
+
+async def init_shared_cache(url: Optional[str] = None, cache_dir: Optional[str] = None) -> None:
+    """
+    Redis 공유 캐시와 디스크 캐시를 초기화합니다.
+    REDIS_URL / CACHE_DIR이 없거나 해당 패키지가 없으면 그 계층은 건너뜁니다.
+
+    Args:
+        url: Redis URL (기본값: REDIS_URL 환경 변수)
+        cache_dir: 디스크 캐시 디렉터리 (기본값: CACHE_DIR 환경 변수)
+    """
+    global _redis, _disk
+    url = url or os.environ.get("REDIS_URL", "")
+    if url and _redis is None:
+        if aioredis is None:
+            logger.warning("REDIS_URL is set but 'redis' package is not installed; skipping shared cache")
+        else:
+            _redis = aioredis.Redis.from_url(url)
+            logger.info("Shared cache enabled | redis=%s", url.split("@")[-1])
+
+    cache_dir = cache_dir or os.environ.get("CACHE_DIR", "")
+    if cache_dir and _disk is None:
+        if diskcache is None:
+            logger.warning("CACHE_DIR is set but 'diskcache' package is not installed; skipping disk cache")
+        else:
+            _disk = diskcache.Cache(cache_dir, size_limit=DISK_CACHE_SIZE_LIMIT)
+            logger.info("Disk cache enabled | dir=%s", cache_dir)
+
+
+async def close_shared_cache() -> None:
+    """Redis 연결과 디스크 캐시를 닫습니다. (서버 종료 시 호출)"""
+    global _redis, _disk
+    if _redis is not None:
+        close = getattr(_redis, "aclose", None) or _redis.close
+        await close()
+        _redis = None
+    if _disk is not None:
+        _disk.close()
+        _disk = None
+
+
+def _shared_key(namespace: str, key: tuple) -> str:
+    """L1 캐시 키(tuple)를 Redis 키 문자열로 변환합니다."""
+    raw = "|".join(str(part) for part in key)
+    return f"{namespace}:{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+
+def _encode(value: Any) -> bytes:
+    """L2 저장용으로 값을 직렬화 후 압축합니다. (법령 전문 등 큰 응답의 저장 공간 절감)"""
+    return zlib.compress(orjson.dumps(value), COMPRESS_LEVEL)
+
+
+def _decode(raw: bytes) -> Any:
+    """_encode로 저장한 값을 복원합니다."""
+    return orjson.loads(zlib.decompress(raw))
+
+
+async def _shared_get(shared_key: str) -> Optional[Any]:
+    """Redis → 디스크 순서로 값을 조회합니다. 오류 시 None (캐시 미스로 취급)"""
+    if _redis is not None:
+        try:
+            raw = await _redis.get(shared_key)
+            if raw is not None:
+                return _decode(raw)
+        except Exception as e:
+            logger.warning("Shared cache get failed: %s", e)
+    if _disk is not None:
+        try:
+            # diskcache(SQLite)는 블로킹 I/O이므로 스레드에서 실행
+            raw = await asyncio.to_thread(_disk.get, shared_key)
+            if raw is not None:
+                return _decode(raw)
+        except Exception as e:
+            logger.warning("Disk cache get failed: %s", e)
+    return None
+
+
+async def _shared_set(shared_key: str, value: Any, ttl: int) -> None:
+    """Redis와 디스크에 값을 저장합니다. 오류는 로깅만 하고 무시합니다."""
+    if _redis is None and _disk is None:
+        return
+    raw = _encode(value)
+    if _redis is not None:
+        try:
+            await _redis.setex(shared_key, ttl, raw)
+        except Exception as e:
+            logger.warning("Shared cache set failed: %s", e)
+    if _disk is not None:
+        try:
+            await asyncio.to_thread(_disk.set, shared_key, raw, expire=ttl)
+        except Exception as e:
+            logger.warning("Disk cache set failed: %s", e)
+
+
+def async_cached(mux: CacheMux, key: Callable[..., tuple], namespace: str, ttl: int = SHARED_CACHE_TTL):
+    """
+    async 함수용 2단 캐시 데코레이터 (cachetools.cached와 같은 형태)
+    L1(mux) → L2(Redis, 디스크) 순서로 조회하고, 성공한 결과만 두 곳에 저장합니다.
+    실패 캐시에 남은 오류는 그대로 반환하며, 실패 기록은 함수 쪽에서 mux.record_failure로 합니다.
+    캐시 미스 상태에서 같은 키로 동시에 들어온 요청은 하나의 조회 결과를 함께 기다립니다.
+
+    Args:
+        mux: 도구별 CacheMux
+        key: 함수 인자를 받아 캐시 키(tuple)를 만드는 함수 (arguments 같은 unhashable 인자는 제외)
+        namespace: Redis 키 접두사 (예: "law")
+        ttl: Redis TTL (초)
+    """
+    def decorator(func):
+        async def load(cache_key: tuple, args: tuple, kwargs: dict):
+            # L2 (공유/디스크) 캐시 확인
+            shared_key = _shared_key(namespace, cache_key)
+            result = await _shared_get(shared_key)
+            if result is not None:
+                logger.debug("Shared cache hit | %s key=%r", namespace, cache_key)
+                mux.record_success(cache_key, result)
+                return result
+
+            result = await func(*args, **kwargs)
+
+            # 성공한 경우에만 캐시에 저장
+            if "error" not in result:
+                mux.record_success(cache_key, result)
+                await _shared_set(shared_key, result, ttl)
+
+            return result
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+
+            tag, value = mux.lookup(cache_key)
+            if tag == "hit" or tag == "neg":
+                # 가장 자주 타는 경로이므로 DEBUG가 꺼져 있으면 로깅 호출 자체를 건너뜀
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s | %s key=%r", "Cache hit" if tag == "hit" else "Failure cache hit, skipping",
+                                 namespace, cache_key)
+                return value
+
+            # 진행 중인 동일 요청이 있으면 합류, 없으면 새로 시작
+            if tag == "inflight":
+                logger.debug("Joining in-flight request | %s key=%r", namespace, cache_key)
+                result = await asyncio.shield(value)
+                # 실패 캐시에 기록되지 않은 오류(인증 오류, API 키 누락 등)는 먼저 호출한 쪽의 인증 정보에
+                # 따른 결과일 수 있으므로 공유하지 않고 직접 조회
+                if "error" in result and not mux.has_failure(cache_key):
+                    return await load(cache_key, args, kwargs)
+                return result
+
+            task = asyncio.ensure_future(load(cache_key, args, kwargs))
+            mux.inflight[cache_key] = task
+            task.add_done_callback(lambda _: mux.inflight.pop(cache_key, None))
+
+            # 한 호출자가 취소되어도 다른 대기자를 위해 조회는 계속 진행
+            return await asyncio.shield(task)
+        return wrapper
+    return decorator
@@ -7,131 +7,89 @@ import asyncio
 import sys
 import os
 import logging
+import hashlib
+import orjson
+import anyio.to_thread
+from concurrent.futures import ThreadPoolExecutor
 from fastmcp import FastMCP
-from fastapi import FastAPI
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import Field
 from .tools import (
     search_law, 
     get_law_detail, 
     search_precedent, 
     get_precedent_detail,
-    search_administrative_rule
+    search_administrative_rule,
+    get_law_details_bulk,
+    get_precedent_details_bulk,
+    search_all,
+    get_credentials,
+    get_http_client,
+    close_http_client
 )
-from typing import Optional
+from .cache import init_shared_cache, close_shared_cache, make_ttl_cache, has_error
+from typing import Annotated, List, Optional
 from dotenv import load_dotenv
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
 
 # .env 파일 로드
 load_dotenv()
 
-# FastAPI / FastMCP 앱 구성
-api = FastAPI()
-mcp_logger = logging.getLogger("law-mcp")
-level = getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
-mcp_logger.setLevel(level)
-if not mcp_logger.handlers:
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
-    mcp_logger.addHandler(handler)
-mcp_logger.propagate = True
-mcp = FastMCP()
-
-
-# Pydantic 모델 정의
-class LawSearchRequest(BaseModel):
-    query: str = Field(..., description="검색할 법령 키워드")
-    page: int = Field(1, description="페이지 번호 (기본값: 1)", ge=1)
-    page_size: int = Field(10, description="페이지당 결과 수 (기본값: 10, 최대: 50)", ge=1, le=50)
-
-
-class LawDetailRequest(BaseModel):
-    law_id: str = Field(..., description="조회할 법령 ID")
-
+# 기본 스레드풀 크기 (asyncio.to_thread 및 FastAPI 동기 처리에 사용)
+THREAD_POOL_SIZE = int(os.environ.get("THREAD_POOL_SIZE", "64"))
 
-class PrecedentSearchRequest(BaseModel):
-    query: str = Field(..., description="검색할 판례 키워드")
-    page: int = Field(1, description="페이지 번호 (기본값: 1)", ge=1)
-    page_size: int = Field(10, description="페이지당 결과 수 (기본값: 10, 최대: 50)", ge=1, le=50)
-    court: Optional[str] = Field(None, description="법원 구분 (예: '대법원', '헌법재판소')")
 
-
-class PrecedentDetailRequest(BaseModel):
-    precedent_id: str = Field(..., description="조회할 판례 일련번호")
-
-
-class AdminRuleSearchRequest(BaseModel):
-    query: str = Field(..., description="검색할 행정규칙 키워드")
-    page: int = Field(1, description="페이지 번호 (기본값: 1)", ge=1)
-    page_size: int = Field(10, description="페이지당 결과 수 (기본값: 10, 최대: 50)", ge=1, le=50)
+def configure_thread_pool() -> None:
+    """실행 중인 이벤트 루프의 기본 스레드풀과 AnyIO 스레드 한도를 THREAD_POOL_SIZE로 설정"""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="law-mcp")
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
 
 
-# 실제 구현 함수들
-async def search_law_impl(req: LawSearchRequest, arguments: Optional[dict] = None):
-    """법령 검색 구현"""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """HTTP 서버 수명 주기: 스레드풀 설정, 공유 HTTP 클라이언트 / 공유 캐시 생성·종료"""
+    configure_thread_pool()
+    get_http_client()
+    await init_shared_cache()
     try:
-        if arguments is None:
-            arguments = {}
-        return await asyncio.to_thread(search_law, req.query, req.page, req.page_size, arguments)
-    except Exception as e:
-        return {"error": f"법령 검색 중 오류가 발생했습니다: {str(e)}"}
-
+        yield
+    finally:
+        await close_shared_cache()
+        await close_http_client()
 
-async def get_law_detail_impl(req: LawDetailRequest, arguments: Optional[dict] = None):
-    """법령 상세 조회 구현"""
-    try:
-        if arguments is None:
-            arguments = {}
-        return await asyncio.to_thread(get_law_detail, req.law_id, arguments)
-    except Exception as e:
-        return {"error": f"법령 상세 조회 중 오류가 발생했습니다: {str(e)}"}
 
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답 (기본 응답 클래스)"""
 
-async def search_precedent_impl(req: PrecedentSearchRequest, arguments: Optional[dict] = None):
-    """판례 검색 구현"""
-    try:
-        if arguments is None:
-            arguments = {}
-        return await asyncio.to_thread(
-            search_precedent, 
-            req.query, 
-            req.page, 
-            req.page_size, 
-            req.court,
-            arguments
-        )
-    except Exception as e:
-        return {"error": f"판례 검색 중 오류가 발생했습니다: {str(e)}"}
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
 
 
-async def get_precedent_detail_impl(req: PrecedentDetailRequest, arguments: Optional[dict] = None):
-    """판례 상세 조회 구현"""
-    try:
-        if arguments is None:
-            arguments = {}
-        return await asyncio.to_thread(get_precedent_detail, req.precedent_id, arguments)
-    except Exception as e:
-        return {"error": f"판례 상세 조회 중 오류가 발생했습니다: {str(e)}"}
+# FastAPI / FastMCP 앱 구성
+api = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+mcp_logger = logging.getLogger("law-mcp")
+level = getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
+mcp_logger.setLevel(level)
+if not mcp_logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    mcp_logger.addHandler(handler)
+mcp_logger.propagate = True
+mcp = FastMCP()
 
 
-async def search_administrative_rule_impl(req: AdminRuleSearchRequest, arguments: Optional[dict] = None):
-    """행정규칙 검색 구현"""
-    try:
-        if arguments is None:
-            arguments = {}
-        return await asyncio.to_thread(
-            search_administrative_rule, 
-            req.query, 
-            req.page, 
-            req.page_size,
-            arguments
-        )
-    except Exception as e:
-        return {"error": f"행정규칙 검색 중 오류가 발생했습니다: {str(e)}"}
+# MCP 도구 파라미터 타입 (도구 스키마 수준에서 범위 검증)
+Page = Annotated[int, Field(ge=1, description="페이지 번호 (기본값: 1)")]
+PageSize = Annotated[int, Field(ge=1, le=50, description="페이지당 결과 수 (기본값: 10, 최대: 50)")]
+IdList = Annotated[List[str], Field(min_length=1, max_length=50)]
 
 
-async def health_impl():
-    """서비스 상태 확인 구현"""
-    api_key = os.environ.get("LAW_API_KEY", "")
+async def health_impl(arguments: Optional[dict] = None):
+    """서비스 상태 확인 구현 (arguments.env의 키가 있으면 우선 사용)"""
+    api_key = get_credentials(arguments)["LAW_API_KEY"]
     api_key_status = "설정됨" if api_key else "설정되지 않음"
     return {
         "status": "ok",
@@ -143,24 +101,6 @@ async def health_impl():
     }
 
 
-# 일시 환경 변수 적용용 컨텍스트 매니저
-@contextmanager
-def temporary_env(overrides: dict):
-    saved_values = {}
-    try:
-        for key, value in (overrides or {}).items():
-            saved_values[key] = os.environ.get(key)
-            if value is not None:
-                os.environ[key] = str(value)
-        yield
-    finally:
-        for key, original in saved_values.items():
-            if original is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = original
-
-
 # HTTP 엔드포인트
 @api.get("/health")
 async def health_check_get():
@@ -175,8 +115,13 @@ async def health_check_post():
 
 # HTTP 엔드포인트: 도구 목록 조회
 @api.get("/tools")
-async def get_tools_http():
-    """HTTP 엔드포인트: 사용 가능한 도구 목록 조회"""
+async def get_tools_http(request: Request):
+    """HTTP 엔드포인트: 사용 가능한 도구 목록 조회 (ETag 일치 시 304)"""
+    return _etag_response(orjson.dumps(await get_tools_list()), request)
+
+
+async def get_tools_list():
+    """사용 가능한 도구 목록을 구성합니다."""
     try:
         # FastMCP의 내부 도구 목록 가져오기
         tools_list = []
@@ -256,6 +201,41 @@ async def get_tools_http():
                         "required": ["precedent_id"]
                     }
                 },
+                {
+                    "name": "search_all_tool",
+                    "description": "법령, 판례, 행정규칙을 같은 키워드로 한 번에 검색합니다.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "query": {"type": "string", "description": "검색할 키워드 (예: '부당해고', '개인정보')"},
+                            "page": {"type": "integer", "description": "페이지 번호 (기본값: 1)", "default": 1, "minimum": 1},
+                            "page_size": {"type": "integer", "description": "대상별 페이지당 결과 수 (기본값: 10, 최대: 50)", "default": 10, "minimum": 1, "maximum": 50}
+                        },
+                        "required": ["query"]
+                    }
+                },
+                {
+                    "name": "get_law_details_bulk_tool",
+                    "description": "여러 법령의 상세 정보를 한 번에 조회합니다.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "law_ids": {"type": "array", "items": {"type": "string"}, "description": "법령 ID 목록 (최대 50개)"}
+                        },
+                        "required": ["law_ids"]
+                    }
+                },
+                {
+                    "name": "get_precedent_details_bulk_tool",
+                    "description": "여러 판례의 상세 정보를 한 번에 조회합니다.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "precedent_ids": {"type": "array", "items": {"type": "string"}, "description": "판례 일련번호 목록 (최대 50개)"}
+                        },
+                        "required": ["precedent_ids"]
+                    }
+                },
                 {
                     "name": "search_administrative_rule_tool",
                     "description": "행정규칙을 키워드로 검색합니다.",
@@ -277,108 +257,111 @@ async def get_tools_http():
         return []
 
 
+# 도구 응답 캐시: 직렬화된 JSON 본문 보관 (1시간, 워커당 본문 크기 합계로 제한)
+# 도구 호출은 POST이고 본문이 호출자의 인증 정보로 계산되므로 HTTP 캐시 헤더(ETag/public)는 붙이지 않음
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+# 이보다 큰 본문(법령 전문 일괄 조회 등)은 저장하지 않음 (결과는 도구 캐시에 이미 있으므로 직렬화만 다시 함)
+RESPONSE_CACHE_MAX_BODY = 256 * 1024
+response_cache = make_ttl_cache(RESPONSE_CACHE_MAX_BYTES, 3600, getsizeof=len)
+
+# GET /tools 응답의 Cache-Control (도구 목록은 호출자와 무관)
+TOOLS_CACHE_CONTROL = "public, max-age=3600, stale-while-revalidate=60"
+
+
+def _response_cache_key(tool_name: str, request_data: dict) -> str:
+    """도구 이름과 인자(env 제외)로 응답 캐시 키를 생성"""
+    params = {k: v for k, v in request_data.items() if k != "env"}
+    raw = tool_name.encode("utf-8") + b"|" + orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _etag_response(body: bytes, request: Request) -> Response:
+    """GET 응답용: ETag가 일치하면 304, 아니면 본문으로 응답"""
+    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": TOOLS_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # HTTP 엔드포인트: 도구 호출
 @api.post("/tools/{tool_name}")
 async def call_tool_http(tool_name: str, request_data: dict):
+    """HTTP 엔드포인트: 도구 호출 (성공한 응답은 직렬화된 형태로 캐시)"""
+    if tool_name == "health":
+        return await call_tool(tool_name, request_data)
+
+    cache_key = _response_cache_key(tool_name, request_data)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        if mcp_logger.isEnabledFor(logging.DEBUG):
+            mcp_logger.debug("Response cache hit | tool=%s", tool_name)
+        return Response(content=cached, media_type="application/json")
+
+    result = await call_tool(tool_name, request_data)
+    if not isinstance(result, dict) or has_error(result):
+        return result
+
+    body = orjson.dumps(result)
+    if len(body) <= RESPONSE_CACHE_MAX_BODY:
+        response_cache[cache_key] = body
+    return Response(content=body, media_type="application/json")
+
+
+# HTTP 도구 호출 디스패치 테이블
+# 도구 이름 -> (함수, 위치 인자로 전달할 키, 필수 키)
+TOOL_DISPATCH = {
+    "health": (health_impl, (), ()),
+    "search_law_tool": (search_law, ("query", "page", "page_size"), ("query",)),
+    "get_law_detail_tool": (get_law_detail, ("law_id",), ("law_id",)),
+    "search_precedent_tool": (search_precedent, ("query", "page", "page_size", "court"), ("query",)),
+    "get_precedent_detail_tool": (get_precedent_detail, ("precedent_id",), ("precedent_id",)),
+    "search_administrative_rule_tool": (search_administrative_rule, ("query", "page", "page_size"), ("query",)),
+    "search_all_tool": (search_all, ("query", "page", "page_size"), ("query",)),
+    "get_law_details_bulk_tool": (get_law_details_bulk, ("law_ids",), ("law_ids",)),
+    "get_precedent_details_bulk_tool": (get_precedent_details_bulk, ("precedent_ids",), ("precedent_ids",)),
+}
+
+# 파라미터 기본값 및 타입 변환 대상
+PARAM_DEFAULTS = {"page": 1, "page_size": 10}
+INT_PARAMS = frozenset({"page", "page_size"})
+LIST_PARAMS = frozenset({"law_ids", "precedent_ids"})
+
+
+def normalize_params(data: dict, keys: tuple) -> None:
+    """지정된 키의 값을 도구 함수가 기대하는 타입으로 변환 (float -> int, 그 외 -> str)"""
+    for key in keys:
+        value = data.get(key)
+        if value is None:
+            continue
+        if key in INT_PARAMS:
+            if isinstance(value, float):
+                data[key] = int(value)
+        elif key in LIST_PARAMS:
+            data[key] = [str(item) for item in value]
+        elif not isinstance(value, str):
+            data[key] = str(value)
+
+
+async def call_tool(tool_name: str, request_data: dict):
+    """도구 이름에 맞는 함수를 찾아 호출"""
     mcp_logger.debug("HTTP call_tool | tool=%s request=%s", tool_name, request_data)
-    env = request_data.get("env", {}) if isinstance(request_data, dict) else {}
 
-    async def run_sync(func, *args, **kwargs):
-        return await asyncio.to_thread(func, *args, **kwargs)
-    
-    # 공통 타입 변환 함수들
-    def convert_float_to_int(data: dict, keys: list):
-        """지정된 키의 float 값을 int로 변환"""
-        for key in keys:
-            if key in data and isinstance(data[key], float):
-                data[key] = int(data[key])
-    
-    def convert_to_str(data: dict, keys: list):
-        """지정된 키의 값을 문자열로 변환"""
-        for key in keys:
-            if key in data and data[key] is not None and not isinstance(data[key], str):
-                data[key] = str(data[key])
+    spec = TOOL_DISPATCH.get(tool_name)
+    if spec is None:
+        return {"error": "Tool not found"}
+    func, keys, required = spec
 
     try:
-        # 크레덴셜 추출
-        creds = {}
-        if isinstance(env, dict):
-            for k in ("LAW_API_KEY", "LAW_API_URL"):
-                if k in env:
-                    creds[k] = env[k]
-        
-        if creds:
-            masked = dict(creds)
-            if "LAW_API_KEY" in masked and masked["LAW_API_KEY"]:
-                masked["LAW_API_KEY"] = masked["LAW_API_KEY"][:6] + "***"
-            mcp_logger.debug("Applying temp env | %s", masked)
-
-        async def run_with_env(func, *args, **kwargs):
-            with temporary_env(creds):
-                return await run_sync(func, *args, **kwargs)
-
-        if tool_name == "health":
-            return await health_impl()
-
-        if tool_name == "search_law_tool":
-            query = request_data.get("query")
-            if not query:
-                return {"error": "Missing required parameter: query"}
-            # 타입 변환
-            convert_float_to_int(request_data, ["page", "page_size"])
-            convert_to_str(request_data, ["query"])
-            page = request_data.get("page", 1)
-            page_size = request_data.get("page_size", 10)
-            return await run_with_env(
-                search_law, query, page, page_size, arguments=request_data
-            )
-
-        if tool_name == "get_law_detail_tool":
-            law_id = request_data.get("law_id")
-            if not law_id:
-                return {"error": "Missing required parameter: law_id"}
-            convert_to_str(request_data, ["law_id"])
-            return await run_with_env(
-                get_law_detail, law_id, arguments=request_data
-            )
-
-        if tool_name == "search_precedent_tool":
-            query = request_data.get("query")
-            if not query:
-                return {"error": "Missing required parameter: query"}
-            # 타입 변환
-            convert_float_to_int(request_data, ["page", "page_size"])
-            convert_to_str(request_data, ["query", "court"])
-            page = request_data.get("page", 1)
-            page_size = request_data.get("page_size", 10)
-            court = request_data.get("court")
-            return await run_with_env(
-                search_precedent, query, page, page_size, court, arguments=request_data
-            )
-
-        if tool_name == "get_precedent_detail_tool":
-            precedent_id = request_data.get("precedent_id")
-            if not precedent_id:
-                return {"error": "Missing required parameter: precedent_id"}
-            convert_to_str(request_data, ["precedent_id"])
-            return await run_with_env(
-                get_precedent_detail, precedent_id, arguments=request_data
-            )
-
-        if tool_name == "search_administrative_rule_tool":
-            query = request_data.get("query")
-            if not query:
-                return {"error": "Missing required parameter: query"}
-            # 타입 변환
-            convert_float_to_int(request_data, ["page", "page_size"])
-            convert_to_str(request_data, ["query"])
-            page = request_data.get("page", 1)
-            page_size = request_data.get("page_size", 10)
-            return await run_with_env(
-                search_administrative_rule, query, page, page_size, arguments=request_data
-            )
-
-        return {"error": "Tool not found"}
+        for key in required:
+            value = request_data.get(key)
+            if not value or (key in LIST_PARAMS and not isinstance(value, list)):
+                return {"error": f"Missing required parameter: {key}"}
+
+        # 타입 변환 후 호출 (크레덴셜은 request_data["env"]로 전달되어 get_credentials에서 처리됨)
+        normalize_params(request_data, keys)
+        args = [request_data.get(key, PARAM_DEFAULTS.get(key)) for key in keys]
+        return await func(*args, arguments=request_data)
     except Exception as e:
         mcp_logger.exception("Error in call_tool_http: %s", str(e))
         return {"error": f"Error calling tool: {str(e)}"}
@@ -394,8 +377,8 @@ async def health():
 @mcp.tool()
 async def search_law_tool(
     query: str,
-    page: int = 1,
-    page_size: int = 10
+    page: Page = 1,
+    page_size: PageSize = 10
 ):
     """
     법령을 키워드로 검색합니다.
@@ -408,8 +391,7 @@ async def search_law_tool(
     Returns:
         검색된 법령 목록
     """
-    req = LawSearchRequest(query=query, page=page, page_size=page_size)
-    return await search_law_impl(req, None)
+    return await search_law(query, page, page_size)
 
 
 @mcp.tool()
@@ -423,15 +405,14 @@ async def get_law_detail_tool(law_id: str):
     Returns:
         법령의 상세 정보와 조문 내용
     """
-    req = LawDetailRequest(law_id=law_id)
-    return await get_law_detail_impl(req, None)
+    return await get_law_detail(law_id)
 
 
 @mcp.tool()
 async def search_precedent_tool(
     query: str,
-    page: int = 1,
-    page_size: int = 10,
+    page: Page = 1,
+    page_size: PageSize = 10,
     court: Optional[str] = None
 ):
     """
@@ -446,13 +427,7 @@ async def search_precedent_tool(
     Returns:
         검색된 판례 목록
     """
-    req = PrecedentSearchRequest(
-        query=query, 
-        page=page, 
-        page_size=page_size, 
-        court=court
-    )
-    return await search_precedent_impl(req, None)
+    return await search_precedent(query, page, page_size, court)
 
 
 @mcp.tool()
@@ -466,15 +441,14 @@ async def get_precedent_detail_tool(precedent_id: str):
     Returns:
         판례의 상세 정보 (판결요지, 판례내용 등)
     """
-    req = PrecedentDetailRequest(precedent_id=precedent_id)
-    return await get_precedent_detail_impl(req, None)
+    return await get_precedent_detail(precedent_id)
 
 
 @mcp.tool()
 async def search_administrative_rule_tool(
     query: str,
-    page: int = 1,
-    page_size: int = 10
+    page: Page = 1,
+    page_size: PageSize = 10
 ):
     """
     행정규칙을 키워드로 검색합니다.
@@ -487,32 +461,91 @@ async def search_administrative_rule_tool(
     Returns:
         검색된 행정규칙 목록
     """
-    req = AdminRuleSearchRequest(query=query, page=page, page_size=page_size)
-    return await search_administrative_rule_impl(req, None)
+    return await search_administrative_rule(query, page, page_size)
+
+
+@mcp.tool()
+async def search_all_tool(
+    query: str,
+    page: Page = 1,
+    page_size: PageSize = 10
+):
+    """
+    법령, 판례, 행정규칙을 같은 키워드로 한 번에 검색합니다. (세 검색을 동시에 요청)
+    
+    Args:
+        query: 검색할 키워드 (예: '부당해고', '개인정보')
+        page: 페이지 번호 (기본값: 1)
+        page_size: 대상별 페이지당 결과 수 (기본값: 10, 최대: 50)
+    
+    Returns:
+        법령(laws), 판례(precedents), 행정규칙(rules) 검색 결과
+    """
+    return await search_all(query, page, page_size)
+
+
+@mcp.tool()
+async def get_law_details_bulk_tool(law_ids: IdList):
+    """
+    여러 법령의 상세 정보를 한 번에 조회합니다.
+    
+    Args:
+        law_ids: 법령 ID 목록 (법령 검색 결과에서 얻은 법령ID, 최대 50개)
+    
+    Returns:
+        법령별 상세 정보와 조문 내용 목록
+    """
+    return await get_law_details_bulk(law_ids)
+
+
+@mcp.tool()
+async def get_precedent_details_bulk_tool(precedent_ids: IdList):
+    """
+    여러 판례의 상세 정보를 한 번에 조회합니다.
+    
+    Args:
+        precedent_ids: 판례 일련번호 목록 (판례 검색 결과에서 얻은 판례일련번호, 최대 50개)
+    
+    Returns:
+        판례별 상세 정보 목록
+    """
+    return await get_precedent_details_bulk(precedent_ids)
 
 
 async def main():
     """MCP 서버를 실행합니다."""
     print("MCP Korean Law & Precedent Server starting...", file=sys.stderr)
     print("Server: korean-law-service", file=sys.stderr)
-    print("Available tools: health, search_law_tool, get_law_detail_tool, search_precedent_tool, get_precedent_detail_tool, search_administrative_rule_tool", file=sys.stderr)
+    print("Available tools: health, search_law_tool, get_law_detail_tool, search_precedent_tool, get_precedent_detail_tool, search_all_tool, get_law_details_bulk_tool, get_precedent_details_bulk_tool, search_administrative_rule_tool", file=sys.stderr)
     
     try:
+        configure_thread_pool()
+        await init_shared_cache()
         await mcp.run_stdio_async()
     except Exception as e:
         print(f"Server error: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc(file=sys.stderr)
         raise
+    finally:
+        await close_shared_cache()
+        await close_http_client()
 
 
 if __name__ == "__main__":
     # MCP 서버로 실행 (stdio 모드)
     # HTTP 서버로 실행하려면 환경 변수 HTTP_MODE=1 설정
     if os.environ.get("HTTP_MODE") == "1":
+        import importlib.util
         import uvicorn
         port = int(os.environ.get('PORT', 8096))
-        uvicorn.run("src.main:api", host="0.0.0.0", port=port, reload=False)
+        # uvloop / httptools가 설치되어 있으면 사용 (Windows 등 미지원 환경은 기본값)
+        loop_impl = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+        http_impl = "httptools" if importlib.util.find_spec("httptools") else "auto"
+        # 워커 수 (기본값: CPU 코어 수, 최소 2). 워커 간 캐시 공유는 REDIS_URL 설정 필요
+        workers = int(os.environ.get("WEB_CONCURRENCY", max(2, os.cpu_count() or 1)))
+        uvicorn.run("src.main:api", host="0.0.0.0", port=port, loop=loop_impl, http=http_impl,
+                    workers=workers, reload=False)
     else:
         # MCP stdio 모드
         asyncio.run(main())
@@ -4,33 +4,108 @@
 국가법령정보센터 Open API 사용
 """
 import os
+import re
 import logging
-import requests
-import xml.etree.ElementTree as ET
-import time
-from cachetools import cached, TTLCache
-from typing import Optional, Dict, List
-from datetime import datetime
+import asyncio
+import random
+import functools
+import httpx
+import orjson
+from typing import Optional, Dict, List, TypedDict
+from .cache import CacheMux, async_cached, make_ttl_cache
 
 # 기본 API URL
 DEFAULT_LAW_API_URL = "https://www.law.go.kr/DRF"
 
-# Logger
+# 대상(target)별 고정 요청 파라미터 (호출마다 OC/검색어 등만 덧붙임)
+_LAW_PARAMS = {"target": "law", "type": "JSON"}  # 법령
+_PREC_PARAMS = {"target": "prec", "type": "JSON"}  # 판례
+_ADMRUL_PARAMS = {"target": "admrul", "type": "JSON"}  # 행정규칙
+
+# Logger (레벨/핸들러 설정은 main.py에서 담당)
 logger = logging.getLogger("law-mcp")
-level = getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
-logger.setLevel(level)
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
-    logger.addHandler(handler)
-logger.propagate = True
-
-# 캐시 설정
-law_cache = TTLCache(maxsize=100, ttl=86400)  # 24시간 유지
-precedent_cache = TTLCache(maxsize=100, ttl=86400)
-detail_cache = TTLCache(maxsize=50, ttl=86400)
-# 실패한 요청 캐시 (불필요한 재시도 방지, 5분 유지)
-failure_cache = TTLCache(maxsize=200, ttl=300)  # 5분
+
+# 캐시 설정 (검색은 소수 인기 키워드에 몰리므로 넉넉하게, 상세는 응답이 커서 따로 제한)
+CACHE_MAXSIZE = int(os.environ.get("CACHE_MAXSIZE", 5000))
+DETAIL_CACHE_MAXSIZE = int(os.environ.get("DETAIL_CACHE_MAXSIZE", 500))
+law_cache = make_ttl_cache(CACHE_MAXSIZE, 86400)  # 24시간 유지
+precedent_cache = make_ttl_cache(CACHE_MAXSIZE, 86400)
+detail_cache = make_ttl_cache(DETAIL_CACHE_MAXSIZE, 86400)
+admrul_cache = make_ttl_cache(CACHE_MAXSIZE, 86400)
+# 도구별 캐시 조회기 (성공 캐시 + 실패 캐시 + 진행 중인 조회)
+_law_mux = CacheMux(law_cache)
+_law_detail_mux = CacheMux(detail_cache)
+_prec_mux = CacheMux(precedent_cache)
+_prec_detail_mux = CacheMux(detail_cache)
+_admrul_mux = CacheMux(admrul_cache)
+
+# 일괄 상세 조회 설정
+BULK_MAX_IDS = 50  # 요청당 최대 ID 수
+BULK_CONCURRENCY = 10  # upstream 동시 요청 수 제한 (모든 일괄 조회 요청 합산)
+_bulk_semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+# 재시도할 upstream 상태 코드 (요청 제한 / 일시적 서버·게이트웨이 오류)
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 인증 오류 상태 코드 (호출자의 API 키에 따라 결과가 달라지므로 실패 캐시에 넣지 않음)
+AUTH_STATUS_CODES = frozenset({401, 403})
+
+# 오류 메시지에서 가릴 API 키 파라미터 (httpx 오류 문자열에는 OC=가 포함된 요청 URL 전체가 들어감)
+_OC_PARAM_RE = re.compile(r"(\bOC=)[^&\s'\"]*")
+
+# 재시도 대기 시간 설정 (지수 백오프, 초)
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 8
+
+# HTTP/2 사용 여부 (기본 사용, LAW_API_HTTP2=0이면 HTTP/1.1)
+# 서버가 ALPN으로 h2를 알리지 않으면 httpx가 자동으로 HTTP/1.1을 사용
+HTTP2_ENABLED = os.environ.get("LAW_API_HTTP2", "1") != "0"
+
+# 공유 HTTP 클라이언트 (연결 재사용을 위해 프로세스당 하나만 유지)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 설정이 켜져 있고 h2 패키지(httpx[http2])가 설치되어 있는지 확인합니다."""
+    if not HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("LAW_API_HTTP2 is enabled but 'h2' package is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공유 httpx.AsyncClient를 반환합니다. 아직 없거나 닫혀 있으면 새로 생성합니다.
+    
+    Returns:
+        keep-alive 연결 풀을 가진 AsyncClient
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30,
+            http2=_http2_available(),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트를 닫습니다. (서버 종료 시 호출)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@functools.lru_cache(maxsize=8)
+def _mask_key(api_key: str) -> str:
+    """로그용 마스킹 키 문자열 (키마다 한 번만 생성)"""
+    return f"{api_key[:6]}***({len(api_key)} chars)" if api_key else "<empty>"
 
 
 def get_credentials(arguments: Optional[dict] = None) -> dict:
@@ -42,51 +117,127 @@ def get_credentials(arguments: Optional[dict] = None) -> dict:
         arguments: 도구 호출 인자
         
     Returns:
-        인증 정보가 담긴 딕셔너리
+        인증 정보가 담긴 딕셔너리 (공유 객체이므로 수정하지 말 것)
     """
-    api_key = ""
-    api_url = DEFAULT_LAW_API_URL
-    key_source = "none"
+    env_key = env_url = None
     
     # 우선순위 1: arguments.env에서 받기 (메인 서버에서 받은 키)
     if isinstance(arguments, dict) and "env" in arguments:
         env = arguments["env"]
         if isinstance(env, dict):
-            if "LAW_API_KEY" in env:
-                api_key = env["LAW_API_KEY"]
-                key_source = "arguments.env"
-            if "LAW_API_URL" in env:
-                api_url = env["LAW_API_URL"]
+            env_key = env.get("LAW_API_KEY")
+            env_url = env.get("LAW_API_URL")
     
     # 우선순위 2: .env 파일에서 받기 (로컬 개발용)
+    return _resolve_credentials(
+        env_key,
+        env_url,
+        os.environ.get("LAW_API_KEY", ""),
+        os.environ.get("LAW_API_URL", DEFAULT_LAW_API_URL)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_credentials(env_key: Optional[str], env_url: Optional[str],
+                         os_key: str, os_url: str) -> dict:
+    """
+    인증 정보 조합별로 한 번만 계산합니다. (입력이 바뀌면 새로 계산)
+    
+    Args:
+        env_key: arguments.env의 LAW_API_KEY (없으면 None)
+        env_url: arguments.env의 LAW_API_URL (없으면 None)
+        os_key: 환경 변수 LAW_API_KEY
+        os_url: 환경 변수 LAW_API_URL
+        
+    Returns:
+        인증 정보가 담긴 딕셔너리
+    """
+    api_key = env_key or ""
+    api_url = env_url if env_url is not None else DEFAULT_LAW_API_URL
+    key_source = "arguments.env" if env_key is not None else "none"
+    
     if not api_key:
-        api_key = os.environ.get("LAW_API_KEY", "")
+        api_key = os_key
         if api_key:
             key_source = ".env file"
     
     if not api_url or api_url == DEFAULT_LAW_API_URL:
-        api_url = os.environ.get("LAW_API_URL", DEFAULT_LAW_API_URL)
+        api_url = os_url
     
     credentials = {
         "LAW_API_KEY": api_key,
-        "LAW_API_URL": api_url
+        "LAW_API_URL": api_url,
+        # 엔드포인트 URL도 base_url이 바뀔 때만 새로 만듦
+        "SEARCH_URL": f"{api_url}/lawSearch.do",
+        "SERVICE_URL": f"{api_url}/lawService.do"
     }
     
     # 로깅 (키 마스킹)
-    masked_key = credentials["LAW_API_KEY"]
-    if masked_key:
-        masked_key = masked_key[:6] + "***" + f"({len(masked_key)} chars)"
-    logger.debug(
-        "Resolved credentials | base_url=%s, api_key=%s, source=%s",
-        credentials.get("LAW_API_URL", DEFAULT_LAW_API_URL),
-        masked_key or "<empty>",
-        key_source
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Resolved credentials | base_url=%s, api_key=%s, source=%s",
+            api_url,
+            _mask_key(api_key),
+            key_source
+        )
     
     return credentials
 
 
-def make_request_with_retry(url: str, params: dict, max_retries: int = 3, timeout: int = 30) -> requests.Response:
+def _redact(text: str) -> str:
+    """
+    오류 메시지/로그에 포함된 요청 URL의 API 키(OC=...)를 가립니다.
+    HTTP 오류는 traceback에도 URL이 들어가므로 logger.exception 대신 이 함수로 가린 메시지만 기록합니다.
+    """
+    return _OC_PARAM_RE.sub(r"\1***", text)
+
+
+def _record_failure(mux: CacheMux, cache_key: tuple, error_result: Dict,
+                    exc: Optional[Exception] = None) -> Dict:
+    """
+    오류 결과를 실패 캐시에 저장하고 반환합니다. (오류 메시지의 API 키는 가림)
+    재시도 대상이 아닌 4xx 응답만 영구 오류로, 나머지(타임아웃/연결/5xx/429)는 일시적 오류로 취급합니다.
+    인증 오류(401/403)는 캐시 키에 API 키가 없어 다른 호출자에게 전달될 수 있으므로 저장하지 않습니다.
+    
+    Args:
+        mux: 도구별 CacheMux
+        cache_key: 캐시 키
+        error_result: {"error": ...} 형태의 오류 결과
+        exc: 원인 예외 (없으면 일시적 오류)
+    
+    Returns:
+        error_result
+    """
+    error_result["error"] = _redact(error_result["error"])
+    status = exc.response.status_code if isinstance(exc, httpx.HTTPStatusError) else None
+    if status in AUTH_STATUS_CODES:
+        return error_result
+    permanent = status is not None and 400 <= status < 500 and status not in RETRY_STATUS_CODES
+    mux.record_failure(cache_key, error_result, permanent)
+    return error_result
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    재시도 대기 시간을 계산합니다.
+    Retry-After 헤더(초)가 있으면 따르고, 없으면 지터를 섞은 지수 백오프를 사용합니다.
+    
+    Args:
+        attempt: 현재 시도 번호 (0부터)
+        response: 재시도 대상 응답 (상태 코드 오류인 경우)
+    
+    Returns:
+        대기 시간 (초)
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), RETRY_BACKOFF_MAX)
+    # 0.5초, 1초, 2초... (±50% 지터로 동시 재시도 분산)
+    return min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2 ** attempt) * (0.5 + random.random()))
+
+
+async def make_request_with_retry(url: str, params: dict, max_retries: int = 3, timeout: int = 30) -> httpx.Response:
     """
     네트워크 요청을 재시도 로직과 함께 수행
     
@@ -100,64 +251,206 @@ def make_request_with_retry(url: str, params: dict, max_retries: int = 3, timeou
         Response 객체
     
     Raises:
-        requests.exceptions.RequestException: 모든 재시도 실패 시
+        httpx.HTTPError: 모든 재시도 실패 시
     """
     last_exception = None
+    client = get_http_client()
     
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, params=params, timeout=timeout)
+            response = await client.get(url, params=params, timeout=timeout)
             response.raise_for_status()
             return response
-        except requests.exceptions.Timeout as e:
+        except httpx.TimeoutException as e:
             last_exception = e
             if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 1  # 1초, 2초, 3초...
-                logger.warning("Request timeout (attempt %d/%d), retrying in %ds...", 
+                wait_time = _retry_delay(attempt)
+                logger.warning("Request timeout (attempt %d/%d), retrying in %.1fs...", 
                              attempt + 1, max_retries, wait_time)
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
             else:
                 logger.error("Request timeout after %d attempts", max_retries)
-        except requests.exceptions.ConnectionError as e:
+        except httpx.NetworkError as e:
             last_exception = e
             if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 1
-                logger.warning("Connection error (attempt %d/%d), retrying in %ds...", 
+                wait_time = _retry_delay(attempt)
+                logger.warning("Connection error (attempt %d/%d), retrying in %.1fs...", 
                              attempt + 1, max_retries, wait_time)
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
             else:
                 logger.error("Connection error after %d attempts", max_retries)
-        except requests.exceptions.RequestException as e:
-            # 재시도 불가능한 오류 (4xx, 5xx 등)
-            logger.error("Request failed (non-retryable): %s", str(e))
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in RETRY_STATUS_CODES:
+                # 재시도 불가능한 오류 (4xx 등)
+                logger.error("Request failed (non-retryable): %s", _redact(str(e)))
+                raise
+            last_exception = e
+            if attempt < max_retries - 1:
+                wait_time = _retry_delay(attempt, e.response)
+                logger.warning("Upstream status %d (attempt %d/%d), retrying in %.1fs...", 
+                             e.response.status_code, attempt + 1, max_retries, wait_time)
+                await asyncio.sleep(wait_time)
+            else:
+                logger.error("Upstream status %d after %d attempts", e.response.status_code, max_retries)
+        except httpx.HTTPError as e:
+            # 재시도 불가능한 오류
+            logger.error("Request failed (non-retryable): %s", _redact(str(e)))
             raise
     
     # 모든 재시도 실패
     if last_exception:
         raise last_exception
     else:
-        raise requests.exceptions.RequestException("모든 재시도가 실패했습니다.")
+        raise httpx.HTTPError("모든 재시도가 실패했습니다.")
+
+
+# 응답 레코드 타입
+class LawRecord(TypedDict):
+    법령ID: str
+    법령명: str
+    법령명_약칭: str
+    법령구분: str
+    소관부처: str
+    공포일자: str
+    공포번호: str
+    시행일자: str
+    제개정구분: str
+
+
+class LawArticle(TypedDict):
+    조문번호: str
+    조문제목: str
+    조문내용: str
+
+
+class LawDetail(TypedDict):
+    법령ID: str
+    법령명: str
+    법령구분: str
+    소관부처: str
+    공포일자: str
+    시행일자: str
+    조문: List[LawArticle]
+    조문수: int
+
+
+class PrecedentRecord(TypedDict):
+    판례일련번호: str
+    사건명: str
+    사건번호: str
+    선고일자: str
+    선고: str
+    법원명: str
+    사건종류명: str
+    판시사항: str
+    판결요지: str
+
 
+class PrecedentDetail(PrecedentRecord):
+    참조조문: str
+    참조판례: str
+    판례내용: str
 
-def parse_xml_response(xml_text: str) -> Dict:
+
+class AdminRuleRecord(TypedDict):
+    행정규칙ID: str
+    행정규칙명: str
+    소관부처: str
+    제정일자: str
+    시행일자: str
+
+
+# 출력 키 -> JSON 응답 키
+_LAW_FIELDS = {
+    "법령ID": "법령ID",
+    "법령명": "법령명한글",
+    "법령명_약칭": "법령약칭명",
+    "법령구분": "법령구분명",
+    "소관부처": "소관부처명",
+    "공포일자": "공포일자",
+    "공포번호": "공포번호",
+    "시행일자": "시행일자",
+    "제개정구분": "제개정구분명",
+}
+_LAW_DETAIL_FIELDS = {
+    "법령ID": "법령ID",
+    "법령명": "법령명_한글",
+    "법령구분": "법종구분",
+    "소관부처": "소관부처",
+    "공포일자": "공포일자",
+    "시행일자": "시행일자",
+}
+_ARTICLE_FIELDS = {
+    "조문번호": "조문번호",
+    "조문제목": "조문제목",
+    "조문내용": "조문내용",
+}
+_PREC_FIELD_NAMES = ("판례일련번호", "사건명", "사건번호", "선고일자", "선고",
+                     "법원명", "사건종류명", "판시사항", "판결요지")
+_PREC_FIELDS = {name: name for name in _PREC_FIELD_NAMES}
+_PREC_DETAIL_FIELDS = {
+    **{name: name for name in _PREC_FIELD_NAMES + ("참조조문", "참조판례", "판례내용")},
+    "판례일련번호": "판례정보일련번호",
+}
+_ADMRUL_FIELDS = {
+    "행정규칙ID": "행정규칙ID",
+    "행정규칙명": "행정규칙명",
+    "소관부처": "소관부처명",
+    "제정일자": "제정일자",
+    "시행일자": "시행일자",
+}
+
+
+def _as_list(value) -> List:
+    """단건이면 dict, 여러 건이면 list로 오는 JSON 값을 list로 정규화합니다."""
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _text(value) -> str:
+    """JSON 값을 문자열로 변환합니다. (속성이 있는 요소는 {"content": ...} 형태)"""
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return _text(value.get("content"))
+    return value if isinstance(value, str) else str(value)
+
+
+def _extract(item: Dict, fields: Dict[str, str]) -> Dict[str, str]:
+    """JSON 객체에서 필드들을 추출하여 출력 키 기준 딕셔너리로 반환합니다."""
+    return {key: _text(item.get(source)) for key, source in fields.items()}
+
+
+def _response_body(data: Dict) -> Dict:
+    """최상위 래퍼 객체(LawSearch, PrecService 등)의 내용을 반환합니다."""
+    if isinstance(data, dict) and len(data) == 1:
+        body = next(iter(data.values()))
+        if isinstance(body, dict):
+            return body
+    return data if isinstance(data, dict) else {}
+
+
+def parse_json_response(content: bytes) -> Optional[Dict]:
     """
-    XML 응답을 파싱하여 딕셔너리로 변환합니다.
+    JSON 응답을 파싱합니다.
     
     Args:
-        xml_text: XML 형식의 응답 텍스트
+        content: JSON 형식의 응답 본문 (bytes)
         
     Returns:
-        파싱된 데이터 딕셔너리
+        파싱된 최상위 객체의 본문 딕셔너리 (실패 시 None)
     """
     try:
-        root = ET.fromstring(xml_text)
-        return root
-    except ET.ParseError as e:
-        logger.error(f"XML 파싱 오류: {str(e)}")
+        return _response_body(orjson.loads(content))
+    except orjson.JSONDecodeError as e:
+        logger.error("JSON 파싱 오류: %s", e)
         return None
 
 
-def _search_law_impl(query: str, page: int, page_size: int, arguments: Optional[dict] = None) -> Dict:
+async def _search_law_impl(query: str, page: int, page_size: int, arguments: Optional[dict] = None) -> Dict:
     """
     법령을 키워드로 검색합니다.
     
@@ -175,61 +468,38 @@ def _search_law_impl(query: str, page: int, page_size: int, arguments: Optional[
     # 캐시 키 생성 (arguments는 hashable하지 않으므로 제외)
     cache_key = (query, page, page_size)
     
-    # 실패 캐시 확인
-    if cache_key in failure_cache:
-        logger.debug("Failure cache hit, skipping | query=%r", query)
-        return failure_cache[cache_key]
-    
     credentials = get_credentials(arguments)
     api_key = credentials["LAW_API_KEY"]
-    base_url = credentials["LAW_API_URL"]
     
     if not api_key:
-        error_result = {"error": "API 키가 설정되지 않았습니다. LAW_API_KEY 환경 변수를 설정해주세요."}
-        failure_cache[cache_key] = error_result
-        return error_result
+        # upstream 호출이 없는 설정 오류이므로 실패 캐시에 넣지 않음 (키 설정 즉시 반영)
+        return {"error": "API 키가 설정되지 않았습니다. LAW_API_KEY 환경 변수를 설정해주세요."}
     
     # API 엔드포인트: 법령검색
-    api_url = f"{base_url}/lawSearch.do"
+    api_url = credentials["SEARCH_URL"]
     
     params = {
+        **_LAW_PARAMS,
         "OC": api_key,
-        "target": "law",
-        "type": "XML",
         "query": query,
         "display": min(page_size, 50),  # 최대 50개
         "page": page
     }
     
     try:
-        response = make_request_with_retry(api_url, params, max_retries=3, timeout=30)
+        response = await make_request_with_retry(api_url, params, max_retries=3, timeout=30)
         
         logger.debug("Law API response | status=%s", response.status_code)
         
-        # XML 파싱
-        root = parse_xml_response(response.text)
-        if root is None:
-            error_result = {"error": "응답 파싱 실패"}
-            failure_cache[cache_key] = error_result
-            return error_result
+        # JSON 파싱
+        body = parse_json_response(response.content)
+        if body is None:
+            return _record_failure(_law_mux, cache_key, {"error": "응답 파싱 실패"})
         
         # 결과 추출
-        laws = []
-        for law in root.findall(".//law"):
-            law_data = {
-                "법령ID": law.findtext("법령ID", ""),
-                "법령명": law.findtext("법령명한글", ""),
-                "법령명_약칭": law.findtext("법령약칭명", ""),
-                "법령구분": law.findtext("법령구분명", ""),
-                "소관부처": law.findtext("소관부처명", ""),
-                "공포일자": law.findtext("공포일자", ""),
-                "공포번호": law.findtext("공포번호", ""),
-                "시행일자": law.findtext("시행일자", ""),
-                "제개정구분": law.findtext("제개정구분명", "")
-            }
-            laws.append(law_data)
-        
-        total_count = root.findtext(".//totalCnt", "0")
+        laws: List[LawRecord] = [_extract(law, _LAW_FIELDS) for law in _as_list(body.get("law"))]
+        
+        total_count = _text(body.get("totalCnt")) or "0"
         
         result = {
             "total": int(total_count),
@@ -241,21 +511,23 @@ def _search_law_impl(query: str, page: int, page_size: int, arguments: Optional[
         logger.debug("Law search results | total=%s returned=%d", total_count, len(laws))
         return result
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         error_msg = f"API 요청 실패: {str(e)}"
-        logger.exception("Law API request failed: %s", str(e))
-        error_result = {"error": error_msg}
-        failure_cache[cache_key] = error_result
-        return error_result
+        logger.error("Law API request failed: %s", _redact(str(e)))
+        return _record_failure(_law_mux, cache_key, {"error": error_msg}, e)
     except Exception as e:
         error_msg = f"법령 검색 중 오류 발생: {str(e)}"
-        logger.exception("Law search error: %s", str(e))
-        error_result = {"error": error_msg}
-        failure_cache[cache_key] = error_result
-        return error_result
+        logger.exception("Law search error: %s", e)
+        return _record_failure(_law_mux, cache_key, {"error": error_msg})
 
 
-def search_law(query: str, page: int = 1, page_size: int = 10, arguments: Optional[dict] = None) -> Dict:
+@async_cached(
+    mux=_law_mux,
+    namespace="law",
+    # arguments는 hashable하지 않으므로 키에서 제외
+    key=lambda query, page=1, page_size=10, arguments=None: (query, page, page_size)
+)
+async def search_law(query: str, page: int = 1, page_size: int = 10, arguments: Optional[dict] = None) -> Dict:
     """
     법령을 키워드로 검색합니다.
     
@@ -268,25 +540,10 @@ def search_law(query: str, page: int = 1, page_size: int = 10, arguments: Option
     Returns:
         검색 결과 딕셔너리
     """
-    # 캐시 키 생성 (arguments는 hashable하지 않으므로 제외)
-    cache_key = (query, page, page_size)
-    
-    # 캐시 확인
-    if cache_key in law_cache:
-        logger.debug("Cache hit | query=%r", query)
-        return law_cache[cache_key]
-    
-    # 실제 구현 호출
-    result = _search_law_impl(query, page, page_size, arguments)
-    
-    # 성공한 경우에만 캐시에 저장
-    if "error" not in result:
-        law_cache[cache_key] = result
-    
-    return result
+    return await _search_law_impl(query, page, page_size, arguments)
 
 
-def _get_law_detail_impl(law_id: str, arguments: Optional[dict] = None) -> Dict:
+async def _get_law_detail_impl(law_id: str, arguments: Optional[dict] = None) -> Dict:
     """
     특정 법령의 상세 정보 및 전문을 조회합니다.
     
@@ -302,59 +559,38 @@ def _get_law_detail_impl(law_id: str, arguments: Optional[dict] = None) -> Dict:
     # 캐시 키 생성
     cache_key = (law_id,)
     
-    # 실패 캐시 확인
-    if cache_key in failure_cache:
-        logger.debug("Failure cache hit, skipping | law_id=%s", law_id)
-        return failure_cache[cache_key]
-    
     credentials = get_credentials(arguments)
     api_key = credentials["LAW_API_KEY"]
-    base_url = credentials["LAW_API_URL"]
     
     if not api_key:
-        error_result = {"error": "API 키가 설정되지 않았습니다."}
-        failure_cache[cache_key] = error_result
-        return error_result
+        # upstream 호출이 없는 설정 오류이므로 실패 캐시에 넣지 않음 (키 설정 즉시 반영)
+        return {"error": "API 키가 설정되지 않았습니다."}
     
     # API 엔드포인트: 법령 상세
-    api_url = f"{base_url}/lawService.do"
+    api_url = credentials["SERVICE_URL"]
     
     params = {
+        **_LAW_PARAMS,
         "OC": api_key,
-        "target": "law",
-        "type": "XML",
         "MST": law_id,
     }
     
     try:
-        response = make_request_with_retry(api_url, params, max_retries=3, timeout=30)
+        response = await make_request_with_retry(api_url, params, max_retries=3, timeout=30)
         
-        # XML 파싱
-        root = parse_xml_response(response.text)
-        if root is None:
-            error_result = {"error": "응답 파싱 실패"}
-            failure_cache[cache_key] = error_result
-            return error_result
+        # JSON 파싱
+        body = parse_json_response(response.content)
+        if body is None:
+            return _record_failure(_law_detail_mux, cache_key, {"error": "응답 파싱 실패"})
         
         # 기본 정보
-        law_info = {
-            "법령ID": root.findtext(".//법령ID", ""),
-            "법령명": root.findtext(".//법령명한글", ""),
-            "법령구분": root.findtext(".//법령구분명", ""),
-            "소관부처": root.findtext(".//소관부처명", ""),
-            "공포일자": root.findtext(".//공포일자", ""),
-            "시행일자": root.findtext(".//시행일자", ""),
-        }
+        law_info: LawDetail = _extract(body.get("기본정보", body), _LAW_DETAIL_FIELDS)
         
         # 조문 정보
-        articles = []
-        for article in root.findall(".//조문"):
-            article_data = {
-                "조문번호": article.findtext("조문번호", ""),
-                "조문제목": article.findtext("조문제목", ""),
-                "조문내용": article.findtext("조문내용", "")
-            }
-            articles.append(article_data)
+        article_units = body.get("조문")
+        if isinstance(article_units, dict):
+            article_units = article_units.get("조문단위")
+        articles: List[LawArticle] = [_extract(article, _ARTICLE_FIELDS) for article in _as_list(article_units)]
         
         law_info["조문"] = articles
         law_info["조문수"] = len(articles)
@@ -362,21 +598,22 @@ def _get_law_detail_impl(law_id: str, arguments: Optional[dict] = None) -> Dict:
         logger.debug("Law detail retrieved | law_id=%s articles=%d", law_id, len(articles))
         return law_info
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         error_msg = f"API 요청 실패: {str(e)}"
-        logger.exception("Law detail API request failed: %s", str(e))
-        error_result = {"error": error_msg}
-        failure_cache[cache_key] = error_result
-        return error_result
+        logger.error("Law detail API request failed: %s", _redact(str(e)))
+        return _record_failure(_law_detail_mux, cache_key, {"error": error_msg}, e)
     except Exception as e:
         error_msg = f"법령 상세 조회 중 오류 발생: {str(e)}"
-        logger.exception("Law detail error: %s", str(e))
-        error_result = {"error": error_msg}
-        failure_cache[cache_key] = error_result
-        return error_result
+        logger.exception("Law detail error: %s", e)
+        return _record_failure(_law_detail_mux, cache_key, {"error": error_msg})
 
 
-def get_law_detail(law_id: str, arguments: Optional[dict] = None) -> Dict:
+@async_cached(
+    mux=_law_detail_mux,
+    namespace="law_detail",
+    key=lambda law_id, arguments=None: (law_id,)
+)
+async def get_law_detail(law_id: str, arguments: Optional[dict] = None) -> Dict:
     """
     특정 법령의 상세 정보 및 전문을 조회합니다.
     
@@ -387,25 +624,15 @@ def get_law_detail(law_id: str, arguments: Optional[dict] = None) -> Dict:
     Returns:
         법령 상세 정보 딕셔너리
     """
-    # 캐시 키 생성 (arguments는 hashable하지 않으므로 제외)
-    cache_key = (law_id,)
-    
-    # 캐시 확인
-    if cache_key in detail_cache:
-        logger.debug("Cache hit | law_id=%s", law_id)
-        return detail_cache[cache_key]
-    
-    # 실제 구현 호출
-    result = _get_law_detail_impl(law_id, arguments)
-    
-    # 성공한 경우에만 캐시에 저장
-    if "error" not in result:
-        detail_cache[cache_key] = result
-    
-    return result
+    return await _get_law_detail_impl(law_id, arguments)
 
 
-def search_precedent(query: str, page: int = 1, page_size: int = 10, court: Optional[str] = None, arguments: Optional[dict] = None) -> Dict:
+@async_cached(
+    mux=_prec_mux,
+    namespace="prec",
+    key=lambda query, page=1, page_size=10, court=None, arguments=None: (query, page, page_size, court)
+)
+async def search_precedent(query: str, page: int = 1, page_size: int = 10, court: Optional[str] = None, arguments: Optional[dict] = None) -> Dict:
     """
     판례를 키워드로 검색합니다.
     
@@ -419,25 +646,10 @@ def search_precedent(query: str, page: int = 1, page_size: int = 10, court: Opti
     Returns:
         판례 검색 결과 딕셔너리
     """
-    # 캐시 키 생성 (arguments는 hashable하지 않으므로 제외)
-    cache_key = (query, page, page_size, court)
-    
-    # 캐시 확인
-    if cache_key in precedent_cache:
-        logger.debug("Cache hit | query=%r", query)
-        return precedent_cache[cache_key]
-    
-    # 실제 구현 호출
-    result = _search_precedent_impl(query, page, page_size, court, arguments)
-    
-    # 성공한 경우에만 캐시에 저장
-    if "error" not in result:
-        precedent_cache[cache_key] = result
-    
-    return result
+    return await _search_precedent_impl(query, page, page_size, court, arguments)
 
 
-def _search_precedent_impl(query: str, page: int = 1, page_size: int = 10, court: Optional[str] = None, arguments: Optional[dict] = None) -> Dict:
+async def _search_precedent_impl(query: str, page: int = 1, page_size: int = 10, court: Optional[str] = None, arguments: Optional[dict] = None) -> Dict:
     """
     판례를 키워드로 검색합니다. (내부 구현)
     
@@ -457,59 +669,36 @@ def _search_precedent_impl(query: str, page: int = 1, page_size: int = 10, court
     # 캐시 키 생성
     cache_key = (query, page, page_size, court)
     
-    # 실패 캐시 확인
-    if cache_key in failure_cache:
-        logger.debug("Failure cache hit, skipping | query=%r", query)
-        return failure_cache[cache_key]
-    
     credentials = get_credentials(arguments)
     api_key = credentials["LAW_API_KEY"]
-    base_url = credentials["LAW_API_URL"]
     
     if not api_key:
-        error_result = {"error": "API 키가 설정되지 않았습니다."}
-        failure_cache[cache_key] = error_result
-        return error_result
+        # upstream 호출이 없는 설정 오류이므로 실패 캐시에 넣지 않음 (키 설정 즉시 반영)
+        return {"error": "API 키가 설정되지 않았습니다."}
     
     # API 엔드포인트: 판례검색
-    api_url = f"{base_url}/lawSearch.do"
+    api_url = credentials["SEARCH_URL"]
     
     params = {
+        **_PREC_PARAMS,
         "OC": api_key,
-        "target": "prec",  # 판례
-        "type": "XML",
         "query": query,
         "display": min(page_size, 50),
         "page": page
     }
     
     try:
-        response = make_request_with_retry(api_url, params, max_retries=3, timeout=30)
+        response = await make_request_with_retry(api_url, params, max_retries=3, timeout=30)
         
-        # XML 파싱
-        root = parse_xml_response(response.text)
-        if root is None:
-            error_result = {"error": "응답 파싱 실패"}
-            failure_cache[cache_key] = error_result
-            return error_result
+        # JSON 파싱
+        body = parse_json_response(response.content)
+        if body is None:
+            return _record_failure(_prec_mux, cache_key, {"error": "응답 파싱 실패"})
         
         # 결과 추출
-        precedents = []
-        for prec in root.findall(".//prec"):
-            prec_data = {
-                "판례일련번호": prec.findtext("판례일련번호", ""),
-                "사건명": prec.findtext("사건명", ""),
-                "사건번호": prec.findtext("사건번호", ""),
-                "선고일자": prec.findtext("선고일자", ""),
-                "선고": prec.findtext("선고", ""),
-                "법원명": prec.findtext("법원명", ""),
-                "사건종류명": prec.findtext("사건종류명", ""),
-                "판시사항": prec.findtext("판시사항", ""),
-                "판결요지": prec.findtext("판결요지", "")
-            }
-            precedents.append(prec_data)
-        
-        total_count = root.findtext(".//totalCnt", "0")
+        precedents: List[PrecedentRecord] = [_extract(prec, _PREC_FIELDS) for prec in _as_list(body.get("prec"))]
+        
+        total_count = _text(body.get("totalCnt")) or "0"
         
         result = {
             "total": int(total_count),
@@ -521,24 +710,40 @@ def _search_precedent_impl(query: str, page: int = 1, page_size: int = 10, court
         logger.debug("Precedent search results | total=%s returned=%d", total_count, len(precedents))
         return result
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         error_msg = f"API 요청 실패: {str(e)}"
-        logger.exception("Precedent API request failed: %s", str(e))
-        error_result = {"error": error_msg}
-        failure_cache[cache_key] = error_result
-        return error_result
+        logger.error("Precedent API request failed: %s", _redact(str(e)))
+        return _record_failure(_prec_mux, cache_key, {"error": error_msg}, e)
     except Exception as e:
         error_msg = f"판례 검색 중 오류 발생: {str(e)}"
-        logger.exception("Precedent search error: %s", str(e))
-        error_result = {"error": error_msg}
-        failure_cache[cache_key] = error_result
-        return error_result
+        logger.exception("Precedent search error: %s", e)
+        return _record_failure(_prec_mux, cache_key, {"error": error_msg})
 
 
-def get_precedent_detail(precedent_id: str, arguments: dict = None) -> Dict:
+@async_cached(
+    mux=_prec_detail_mux,
+    namespace="prec_detail",
+    # get_law_detail 항목과 겹치지 않도록 "prec" 접두사 사용
+    key=lambda precedent_id, arguments=None: ("prec", precedent_id)
+)
+async def get_precedent_detail(precedent_id: str, arguments: Optional[dict] = None) -> Dict:
     """
     특정 판례의 상세 정보를 조회합니다.
     
+    Args:
+        precedent_id: 판례 일련번호
+        arguments: 추가 인자
+        
+    Returns:
+        판례 상세 정보 딕셔너리
+    """
+    return await _get_precedent_detail_impl(precedent_id, arguments)
+
+
+async def _get_precedent_detail_impl(precedent_id: str, arguments: Optional[dict] = None) -> Dict:
+    """
+    특정 판례의 상세 정보를 조회합니다. (내부 구현)
+    
     Args:
         precedent_id: 판례 일련번호
         arguments: 추가 인자
@@ -548,64 +753,73 @@ def get_precedent_detail(precedent_id: str, arguments: dict = None) -> Dict:
     """
     logger.debug("get_precedent_detail called | precedent_id=%s", precedent_id)
     
+    # 캐시 키 생성 (get_precedent_detail 데코레이터와 동일)
+    cache_key = ("prec", precedent_id)
+    
     credentials = get_credentials(arguments)
     api_key = credentials["LAW_API_KEY"]
-    base_url = credentials["LAW_API_URL"]
     
     if not api_key:
         return {"error": "API 키가 설정되지 않았습니다."}
     
     # API 엔드포인트: 판례 상세
-    api_url = f"{base_url}/lawService.do"
+    api_url = credentials["SERVICE_URL"]
     
     params = {
+        **_PREC_PARAMS,
         "OC": api_key,
-        "target": "prec",
-        "type": "XML",
         "ID": precedent_id,
     }
     
     try:
-        response = requests.get(api_url, params=params, timeout=30)
-        response.raise_for_status()
+        response = await make_request_with_retry(api_url, params, max_retries=3, timeout=30)
         
-        # XML 파싱
-        root = parse_xml_response(response.text)
-        if root is None:
-            return {"error": "응답 파싱 실패"}
+        # JSON 파싱
+        body = parse_json_response(response.content)
+        if body is None:
+            return _record_failure(_prec_detail_mux, cache_key, {"error": "응답 파싱 실패"})
         
         # 상세 정보 추출
-        prec_info = {
-            "판례일련번호": root.findtext(".//판례일련번호", ""),
-            "사건명": root.findtext(".//사건명", ""),
-            "사건번호": root.findtext(".//사건번호", ""),
-            "선고일자": root.findtext(".//선고일자", ""),
-            "선고": root.findtext(".//선고", ""),
-            "법원명": root.findtext(".//법원명", ""),
-            "사건종류명": root.findtext(".//사건종류명", ""),
-            "판시사항": root.findtext(".//판시사항", ""),
-            "판결요지": root.findtext(".//판결요지", ""),
-            "참조조문": root.findtext(".//참조조문", ""),
-            "참조판례": root.findtext(".//참조판례", ""),
-            "판례내용": root.findtext(".//판례내용", "")
-        }
+        prec_info: PrecedentDetail = _extract(body, _PREC_DETAIL_FIELDS)
         
         logger.debug("Precedent detail retrieved | precedent_id=%s", precedent_id)
         return prec_info
         
-    except requests.exceptions.RequestException as e:
-        logger.exception("Precedent detail API request failed: %s", str(e))
-        return {"error": f"API 요청 실패: {str(e)}"}
+    except httpx.HTTPError as e:
+        logger.error("Precedent detail API request failed: %s", _redact(str(e)))
+        return _record_failure(_prec_detail_mux, cache_key, {"error": f"API 요청 실패: {str(e)}"}, e)
     except Exception as e:
-        logger.exception("Precedent detail error: %s", str(e))
-        return {"error": f"판례 상세 조회 중 오류 발생: {str(e)}"}
+        logger.exception("Precedent detail error: %s", e)
+        return _record_failure(_prec_detail_mux, cache_key, {"error": f"판례 상세 조회 중 오류 발생: {str(e)}"})
 
 
-def search_administrative_rule(query: str, page: int = 1, page_size: int = 10, 
-                               arguments: dict = None) -> Dict:
+@async_cached(
+    mux=_admrul_mux,
+    namespace="admrul",
+    key=lambda query, page=1, page_size=10, arguments=None: (query, page, page_size)
+)
+async def search_administrative_rule(query: str, page: int = 1, page_size: int = 10, 
+                                     arguments: Optional[dict] = None) -> Dict:
     """
     행정규칙을 키워드로 검색합니다.
     
+    Args:
+        query: 검색할 키워드
+        page: 페이지 번호
+        page_size: 페이지당 결과 수
+        arguments: 추가 인자
+        
+    Returns:
+        행정규칙 검색 결과 딕셔너리
+    """
+    return await _search_administrative_rule_impl(query, page, page_size, arguments)
+
+
+async def _search_administrative_rule_impl(query: str, page: int, page_size: int, 
+                                           arguments: Optional[dict] = None) -> Dict:
+    """
+    행정규칙을 키워드로 검색합니다. (내부 구현)
+    
     Args:
         query: 검색할 키워드
         page: 페이지 번호
@@ -618,47 +832,38 @@ def search_administrative_rule(query: str, page: int = 1, page_size: int = 10,
     logger.debug("search_administrative_rule called | query=%r page=%s page_size=%s", 
                  query, page, page_size)
     
+    # 캐시 키 생성 (search_administrative_rule 데코레이터와 동일)
+    cache_key = (query, page, page_size)
+    
     credentials = get_credentials(arguments)
     api_key = credentials["LAW_API_KEY"]
-    base_url = credentials["LAW_API_URL"]
     
     if not api_key:
         return {"error": "API 키가 설정되지 않았습니다."}
     
     # API 엔드포인트: 행정규칙 검색
-    api_url = f"{base_url}/lawSearch.do"
+    api_url = credentials["SEARCH_URL"]
     
     params = {
+        **_ADMRUL_PARAMS,
         "OC": api_key,
-        "target": "admrul",  # 행정규칙
-        "type": "XML",
         "query": query,
         "display": min(page_size, 50),
         "page": page
     }
     
     try:
-        response = requests.get(api_url, params=params, timeout=30)
-        response.raise_for_status()
+        response = await make_request_with_retry(api_url, params, max_retries=3, timeout=30)
         
-        # XML 파싱
-        root = parse_xml_response(response.text)
-        if root is None:
-            return {"error": "응답 파싱 실패"}
+        # JSON 파싱
+        body = parse_json_response(response.content)
+        if body is None:
+            return _record_failure(_admrul_mux, cache_key, {"error": "응답 파싱 실패"})
         
         # 결과 추출
-        rules = []
-        for rule in root.findall(".//admrul"):
-            rule_data = {
-                "행정규칙ID": rule.findtext("행정규칙ID", ""),
-                "행정규칙명": rule.findtext("행정규칙명", ""),
-                "소관부처": rule.findtext("소관부처명", ""),
-                "제정일자": rule.findtext("제정일자", ""),
-                "시행일자": rule.findtext("시행일자", "")
-            }
-            rules.append(rule_data)
-        
-        total_count = root.findtext(".//totalCnt", "0")
+        rules: List[AdminRuleRecord] = [_extract(rule, _ADMRUL_FIELDS) for rule in _as_list(body.get("admrul"))]
+        
+        total_count = _text(body.get("totalCnt")) or "0"
         
         result = {
             "total": int(total_count),
@@ -671,10 +876,78 @@ def search_administrative_rule(query: str, page: int = 1, page_size: int = 10,
                     total_count, len(rules))
         return result
         
-    except requests.exceptions.RequestException as e:
-        logger.exception("Administrative rule API request failed: %s", str(e))
-        return {"error": f"API 요청 실패: {str(e)}"}
+    except httpx.HTTPError as e:
+        logger.error("Administrative rule API request failed: %s", _redact(str(e)))
+        return _record_failure(_admrul_mux, cache_key, {"error": f"API 요청 실패: {str(e)}"}, e)
     except Exception as e:
-        logger.exception("Administrative rule search error: %s", str(e))
-        return {"error": f"행정규칙 검색 중 오류 발생: {str(e)}"}
+        logger.exception("Administrative rule search error: %s", e)
+        return _record_failure(_admrul_mux, cache_key, {"error": f"행정규칙 검색 중 오류 발생: {str(e)}"})
+
+
+async def search_all(query: str, page: int = 1, page_size: int = 10,
+                     arguments: Optional[dict] = None) -> Dict:
+    """
+    법령, 판례, 행정규칙을 같은 키워드로 동시에 검색합니다.
+    
+    Args:
+        query: 검색할 키워드
+        page: 페이지 번호
+        page_size: 페이지당 결과 수
+        arguments: 추가 인자
+        
+    Returns:
+        대상별 검색 결과 딕셔너리 (대상별 실패는 해당 항목에 error로 표시)
+    """
+    laws, precedents, rules = await asyncio.gather(
+        search_law(query, page, page_size, arguments=arguments),
+        search_precedent(query, page, page_size, arguments=arguments),
+        search_administrative_rule(query, page, page_size, arguments=arguments),
+    )
+    return {"laws": laws, "precedents": precedents, "rules": rules}
 
+
+async def _gather_bounded(func, ids: List[str], arguments: Optional[dict]) -> List[Dict]:
+    """ID 목록을 동시 요청 수를 제한하여 병렬 조회합니다. (결과는 입력 순서 유지)"""
+    async def fetch(item_id: str) -> Dict:
+        async with _bulk_semaphore:
+            return await func(item_id, arguments)
+    
+    return await asyncio.gather(*(fetch(item_id) for item_id in ids))
+
+
+async def get_law_details_bulk(law_ids: List[str], arguments: Optional[dict] = None) -> Dict:
+    """
+    여러 법령의 상세 정보를 한 번에 조회합니다.
+    
+    Args:
+        law_ids: 법령 ID 목록 (최대 50개)
+        arguments: 추가 인자
+        
+    Returns:
+        법령 상세 정보 목록 딕셔너리 (항목별 실패는 해당 항목에 error로 표시)
+    """
+    if len(law_ids) > BULK_MAX_IDS:
+        return {"error": f"한 번에 최대 {BULK_MAX_IDS}개까지 조회할 수 있습니다."}
+    
+    laws = await _gather_bounded(get_law_detail, law_ids, arguments)
+    logger.debug("Law detail bulk retrieved | count=%d", len(laws))
+    return {"count": len(laws), "laws": laws}
+
+
+async def get_precedent_details_bulk(precedent_ids: List[str], arguments: Optional[dict] = None) -> Dict:
+    """
+    여러 판례의 상세 정보를 한 번에 조회합니다.
+    
+    Args:
+        precedent_ids: 판례 일련번호 목록 (최대 50개)
+        arguments: 추가 인자
+        
+    Returns:
+        판례 상세 정보 목록 딕셔너리 (항목별 실패는 해당 항목에 error로 표시)
+    """
+    if len(precedent_ids) > BULK_MAX_IDS:
+        return {"error": f"한 번에 최대 {BULK_MAX_IDS}개까지 조회할 수 있습니다."}
+    
+    precedents = await _gather_bounded(get_precedent_detail, precedent_ids, arguments)
+    logger.debug("Precedent detail bulk retrieved | count=%d", len(precedents))
+    return {"count": len(precedents), "precedents": precedents}
@@ -6,13 +6,17 @@ Gemini Function Calling 테스트 스크립트
 import os
 import json
 import asyncio
-import time
-import re
-from typing import Optional
+import hashlib
+import functools
+import traceback
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Optional, Tuple
+import httpx
+import orjson
+from cachetools import LRUCache
 from dotenv import load_dotenv
-import google.generativeai as genai
-from google.generativeai.generative_models import GenerativeModel
-from google.api_core import exceptions as google_exceptions
+from src.cache import has_error
 
 # .env 파일 로드
 load_dotenv()
@@ -34,58 +38,183 @@ if not LAW_API_KEY:
 if GEMINI_API_KEY:
     os.environ["GOOGLE_API_KEY"] = GEMINI_API_KEY
 
-if GEMINI_API_KEY:
+# MCP 서버 주소
+MCP_SERVER_URL = "http://localhost:8096"
+
+# 도구 호출 요청에 붙이는 env 블록 (API 키는 실행 중 바뀌지 않으므로 한 번만 생성, 수정 금지)
+_ENV_BLOCK = {"env": {"LAW_API_KEY": LAW_API_KEY}}
+
+# 결과 요약 로그에 출력할 응답 본문 길이 (바이트)
+SUMMARY_BYTES = 200
+
+# 도구 호출 결과 캐시 (같은 도구·인자로 다시 호출하면 서버 요청 생략, NO_CACHE=1이면 사용 안 함)
+NO_CACHE = os.environ.get("NO_CACHE", "").lower() in ("1", "true", "yes")
+_RESULT_CACHE: LRUCache = LRUCache(maxsize=256)
+
+# 결과가 인자에만 의존하는 조회 도구 (캐시 대상)
+_CACHEABLE_TOOLS = frozenset({
+    "search_law_tool",
+    "get_law_detail_tool",
+    "search_precedent_tool",
+    "get_precedent_detail_tool",
+    "search_administrative_rule_tool",
+    "search_all_tool",
+    "get_law_details_bulk_tool",
+    "get_precedent_details_bulk_tool",
+})
+
+# 연결 풀 설정 (keep-alive로 연결 재사용)
+_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+
+# 도구 목록 조회용 동기 클라이언트
+_CLIENT = httpx.Client(limits=_LIMITS)
+
+# Gemini가 지원하지 않는 JSON Schema 필드
+_UNSUPPORTED_SCHEMA_KEYS = frozenset({"default", "minimum", "maximum"})
+
+# 변환된 도구 목록 디스크 캐시 (서버 주소별, ETag로 변경 여부만 확인하여 변환 생략)
+TOOLS_CACHE_DIR = Path.home() / ".cache" / "korean-law-mcp"
+
+# VERBOSE=1이면 Function Call 인자를 보기 좋게 들여쓰기해서 출력
+VERBOSE = os.environ.get("VERBOSE", "").lower() in ("1", "true", "yes")
+_ARGS_DUMP_OPTION = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if VERBOSE else 0)
+
+# 테스트 쿼리 동시 실행 수 (Gemini API 요청 제한 고려)
+QUERY_CONCURRENCY = 2
+
+# 도구 호출용 비동기 클라이언트 (여러 Function Call을 동시에 실행)
+_ASYNC_CLIENT = httpx.AsyncClient(limits=_LIMITS, timeout=30)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_genai():
+    """
+    google.generativeai를 처음 사용할 때 가져와 API 키를 설정합니다.
+    (protobuf 등을 함께 불러와 import 비용이 크므로 서버 확인 등이 끝난 뒤로 지연)
+    
+    Returns:
+        (genai 모듈, google.api_core.exceptions 모듈)
+    """
+    import google.generativeai as genai
+    from google.api_core import exceptions as google_exceptions
+    
     try:
         configure_func = getattr(genai, 'configure', None)
         if configure_func:
             configure_func(api_key=GEMINI_API_KEY)
             print("[OK] genai.configure()로 API 키 설정 완료")
-    except Exception as e:
+    except Exception:
+        pass
+    return genai, google_exceptions
+
+
+def _tools_cache_path(server_url: str) -> Path:
+    """서버 주소별 도구 목록 캐시 파일 경로"""
+    digest = hashlib.sha1(server_url.encode("utf-8")).hexdigest()[:12]
+    return TOOLS_CACHE_DIR / f"tools-{digest}.json"
+
+
+def _load_tools_cache(path: Path) -> Optional[dict]:
+    """캐시 파일({"etag": ..., "tools": [...]})을 읽습니다. 없거나 손상되었으면 None"""
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) and "tools" in cached else None
+
+
+def _save_tools_cache(path: Path, etag: Optional[str], tools: list) -> None:
+    """변환된 도구 목록과 ETag를 캐시 파일에 저장합니다. (실패해도 무시)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"etag": etag, "tools": tools}, ensure_ascii=False), encoding="utf-8")
+    except OSError:
         pass
 
-def get_mcp_tools() -> Optional[list]:
+
+def _freeze(obj: Any) -> Any:
+    """dict/list를 읽기 전용 구조(MappingProxyType/tuple)로 변환합니다."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _thaw(obj: Any) -> Any:
+    """_freeze로 만든 구조를 새 dict/list로 복사합니다. (Gemini SDK는 dict만 받음)"""
+    if isinstance(obj, MappingProxyType):
+        return {k: _thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
+def _normalize_tool(tool: dict) -> dict:
+    """MCP 도구 정의 하나를 Gemini function declaration 형식으로 변환합니다."""
+    parameters = tool.get("parameters", {})
+    
+    # Gemini는 default, minimum, maximum 필드를 지원하지 않으므로 제거 (서버 응답은 수정하지 않음)
+    if isinstance(parameters, dict) and "properties" in parameters:
+        parameters = {
+            **parameters,
+            "properties": {
+                name: {k: v for k, v in prop.items() if k not in _UNSUPPORTED_SCHEMA_KEYS}
+                if isinstance(prop, dict) else prop
+                for name, prop in parameters["properties"].items()
+            }
+        }
+    
+    return {
+        "name": tool.get("name", ""),
+        "description": tool.get("description", ""),
+        "parameters": parameters
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_mcp_tools(server_url: str) -> tuple:
+    """
+    서버 주소별로 변환된 도구 목록을 한 번만 가져와 읽기 전용 구조로 보관합니다.
+    실패 시 예외를 그대로 올려 캐시되지 않도록 합니다.
+    """
+    cache_path = _tools_cache_path(server_url)
+    cached = _load_tools_cache(cache_path)
+    
+    # 항상 조건부 요청을 보냄 (304 한 번으로 서버 실행 여부와 캐시 유효성을 함께 확인)
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+    response = _CLIENT.get(f"{server_url}/tools", headers=headers, timeout=10)
+    
+    # 변경 없음: 캐시 재사용
+    if response.status_code == 304 and cached:
+        return _freeze(cached["tools"])
+    
+    response.raise_for_status()
+    tools_list = orjson.loads(response.content)
+    
+    # Gemini Function Calling 형식으로 변환 (health 도구는 테스트용이 아니므로 제외)
+    function_declarations = [_normalize_tool(tool) for tool in tools_list if tool.get("name") != "health"]
+    
+    tools = [{
+        "function_declarations": function_declarations
+    }]
+    _save_tools_cache(cache_path, response.headers.get("ETag"), tools)
+    return _freeze(tools)
+
+
+def get_mcp_tools() -> Optional[tuple]:
     """
     MCP 서버에서 도구 목록을 가져와서 Gemini Function Calling 형식으로 변환합니다.
+    변환 결과는 디스크에 캐시하며, 매번 ETag로 변경 여부만 확인합니다.
+    반환값은 읽기 전용이므로 모델에 넘길 때는 _thaw로 복사해서 사용합니다.
+    
+    Raises:
+        httpx.ConnectError: 서버에 연결할 수 없는 경우 (서버 미실행)
     """
-    import requests
     try:
-        response = requests.get("http://localhost:8096/tools", timeout=10)
-        response.raise_for_status()
-        tools_list = response.json()
-        
-        # Gemini Function Calling 형식으로 변환
-        function_declarations = []
-        
-        for tool in tools_list:
-            tool_name = tool.get("name", "")
-            description = tool.get("description", "")
-            parameters = tool.get("parameters", {})
-            
-            # health 도구는 제외 (테스트용이 아님)
-            if tool_name == "health":
-                continue
-            
-            # Gemini는 default, minimum, maximum 필드를 지원하지 않으므로 제거
-            if isinstance(parameters, dict) and "properties" in parameters:
-                for prop_name, prop_value in parameters["properties"].items():
-                    if isinstance(prop_value, dict):
-                        prop_value.pop("default", None)
-                        prop_value.pop("minimum", None)
-                        prop_value.pop("maximum", None)
-            
-            # Gemini 형식으로 변환
-            function_declaration = {
-                "name": tool_name,
-                "description": description,
-                "parameters": parameters
-            }
-            
-            function_declarations.append(function_declaration)
-        
-        return [{
-            "function_declarations": function_declarations
-        }]
-        
+        return _fetch_mcp_tools(MCP_SERVER_URL)
+    except httpx.ConnectError:
+        raise
     except Exception as e:
         print(f"[WARNING] MCP 서버에서 도구 목록을 가져오지 못했습니다: {str(e)}")
         print("   하드코딩된 도구 목록을 사용합니다.")
@@ -94,7 +223,8 @@ def get_mcp_tools() -> Optional[list]:
 
 # Function Calling을 위한 도구 정의 (Gemini 형식)
 # MCP 서버에서 동적으로 가져오거나, fallback으로 하드코딩된 목록 사용
-TOOLS = [
+# 읽기 전용으로 보관하여 SDK가 넘겨받은 목록을 수정해도 다음 실행에 영향이 없도록 함
+TOOLS = _freeze([
     {
         "function_declarations": [
             {
@@ -197,33 +327,173 @@ TOOLS = [
             }
         ]
     }
-]
+])
 
 
-def call_mcp_tool(tool_name: str, arguments: dict) -> dict:
+async def call_mcp_tool(tool_name: str, arguments: dict) -> Tuple[dict, str]:
     """
     MCP 서버의 도구를 호출합니다.
+    조회 도구의 성공 결과는 (도구 이름, 정렬된 인자 JSON)을 키로 캐시합니다.
+    
+    Returns:
+        (결과 dict, 로그용 요약) - 요약은 디코딩 전 응답 본문 앞부분에서 잘라 만듦
+        (법령 전문처럼 큰 결과를 요약 출력을 위해 다시 문자열로 만들지 않도록)
     """
-    import requests
+    cacheable = not NO_CACHE and tool_name in _CACHEABLE_TOOLS
+    if cacheable:
+        cache_key = (tool_name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS))
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
     
     # API 키를 env에 포함
-    request_data = {
-        **arguments,
-        "env": {
-            "LAW_API_KEY": LAW_API_KEY
-        }
-    }
+    request_data = {**arguments, **_ENV_BLOCK}
     
     try:
-        response = requests.post(
-            f"http://localhost:8096/tools/{tool_name}",
-            json=request_data,
-            timeout=30
+        response = await _ASYNC_CLIENT.post(
+            f"{MCP_SERVER_URL}/tools/{tool_name}",
+            json=request_data
         )
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        return {"error": f"API 요청 실패: {str(e)}"}
+        body = response.content
+        result = orjson.loads(body)
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+        # JSON이 아닌 응답(프록시 오류 페이지 등)도 오류 결과로 반환
+        result = {"error": f"API 요청 실패: {str(e)}"}
+        return result, str(result)
+    
+    # 잘린 멀티바이트 문자는 버림
+    summary = body[:SUMMARY_BYTES].decode("utf-8", "ignore")
+    
+    # 성공한 경우에만 캐시에 저장 (서버는 도구 오류도 200 + {"error": ...}로 응답)
+    if cacheable and not has_error(result):
+        _RESULT_CACHE[cache_key] = (result, summary)
+    return result, summary
+
+
+def _extract_parts(response) -> list:
+    """Gemini 응답의 첫 번째 후보에서 parts를 꺼냅니다. 없으면 빈 리스트"""
+    candidates = getattr(response, "candidates", None)
+    if not candidates:
+        return []
+    content = getattr(candidates[0], "content", None)
+    return list(getattr(content, "parts", None) or [])
+
+
+def _response_text(response, parts: list) -> str:
+    """parts의 텍스트를 이어 붙입니다. 텍스트가 없으면 응답 전체를 문자열로 반환"""
+    text_parts = [text for text in (getattr(p, "text", "") for p in parts) if text]
+    return "\n".join(text_parts) if text_parts else str(response)
+
+
+def _args(fc) -> dict:
+    """
+    Function Call 인자를 dict로 변환합니다.
+    dict(fc.args)는 얕은 변환이라 배열 인자가 RepeatedComposite로 남으므로 proto 변환으로 재귀적으로 바꿈
+    """
+    return type(fc).to_dict(fc).get("args") or {}
+
+
+async def _run_query(model, index: int, query: str, semaphore: asyncio.Semaphore) -> None:
+    """
+    테스트 쿼리 하나를 실행합니다.
+    동시에 실행되는 다른 쿼리와 출력이 섞이지 않도록 모아 두었다가 한 번에 출력합니다.
+    """
+    _, google_exceptions = _get_genai()
+    lines = []
+    
+    def log(text: str = "") -> None:
+        lines.append(text)
+    
+    try:
+        async with semaphore:
+            log(f"\n{'=' * 80}")
+            log(f"테스트 {index}: {query}")
+            log('=' * 80)
+            log()
+            
+            try:
+                # 채팅 시작
+                chat = model.start_chat()
+                
+                # 사용자 메시지 전송
+                log(f"[USER] 사용자: {query}")
+                log()
+                
+                response = await chat.send_message_async(query)
+                
+                # 응답 처리
+                parts = _extract_parts(response)
+                
+                # Function Call이 있는지 확인
+                # (proto Part는 텍스트 part에도 빈 function_call이 있으므로 값이 있는 것만 선택)
+                function_calls = list(filter(None, (getattr(part, "function_call", None) for part in parts)))
+                
+                if function_calls:
+                    # fc.args(MapComposite)는 호출마다 한 번만 dict로 변환해서 출력과 실행에 함께 사용
+                    requested = [(fc.name, _args(fc)) for fc in function_calls]
+                    
+                    log("[FUNCTION CALL] Function Calls 감지:")
+                    for tool_name, arguments in requested:
+                        log(f"   - {tool_name}({orjson.dumps(arguments, option=_ARGS_DUMP_OPTION).decode()})")
+                    log()
+                    
+                    # Function Call 실행 (서로 독립적이므로 동시에 호출)
+                    calls = []
+                    for tool_name, arguments in requested:
+                        # tool_name이 비어있으면 건너뛰기
+                        if not tool_name:
+                            log("[WARNING] Function call name이 비어있습니다. 건너뜁니다.")
+                            continue
+                        
+                        log(f"[CALL] MCP 도구 호출: {tool_name}")
+                        calls.append((tool_name, arguments))
+                    
+                    results = await asyncio.gather(
+                        *(call_mcp_tool(tool_name, arguments) for tool_name, arguments in calls)
+                    )
+                    
+                    function_responses = []
+                    for (tool_name, _), (result, summary) in zip(calls, results):
+                        log(f"[RESULT] 결과 수신 (요약): {summary}...")
+                        log()
+                        
+                        function_responses.append({
+                            "function_response": {
+                                "name": tool_name,
+                                "response": result
+                            }
+                        })
+                    
+                    # 모든 Function Response를 한 번의 턴으로 모델에 전달 (호출 수만큼 왕복하지 않음)
+                    if function_responses:
+                        response = await chat.send_message_async(function_responses)
+                    
+                    parts = _extract_parts(response)
+                
+                # 최종 응답 출력
+                log("[GEMINI] Gemini 응답:")
+                log(_response_text(response, parts))
+                
+                log()
+                
+            except google_exceptions.ResourceExhausted as e:
+                log(f"[ERROR] API 할당량 초과: {str(e)}")
+                log("   잠시 후 다시 시도해주세요.")
+                # 다시 올려서 TaskGroup이 남은 쿼리를 취소하도록 함 (할당량 낭비 방지)
+                raise
+            except asyncio.CancelledError:
+                log("[CANCELLED] 다른 쿼리의 할당량 초과로 취소되었습니다.")
+                raise
+            except Exception as e:
+                log(f"[ERROR] 오류 발생: {str(e)}")
+                log(traceback.format_exc())
+            
+            log()
+    finally:
+        # 세마포어를 기다리다 취소된 쿼리는 출력할 내용이 없음
+        if lines:
+            print("\n".join(lines))
 
 
 async def test_gemini_function_calling():
@@ -235,9 +505,18 @@ async def test_gemini_function_calling():
     print("=" * 80)
     print()
     
-    # MCP 서버에서 도구 목록 가져오기 시도
-    mcp_tools = get_mcp_tools()
-    tools_to_use = mcp_tools if mcp_tools else TOOLS
+    # MCP 서버에서 도구 목록 가져오기 시도 (별도 health 확인 없이 목록 요청의 연결 오류로 서버 실행 여부 판단)
+    try:
+        mcp_tools = get_mcp_tools()
+    except httpx.ConnectError:
+        print("[ERROR] MCP 서버에 연결할 수 없습니다.")
+        print("   먼저 다음 명령으로 서버를 실행해주세요:")
+        print("   HTTP_MODE=1 python -m src.main")
+        print()
+        print("   또는 .env 파일에 HTTP_MODE=1 추가 후:")
+        print("   python -m src.main")
+        exit(1)
+    tools_to_use = _thaw(mcp_tools if mcp_tools else TOOLS)
     
     if mcp_tools:
         print("[OK] MCP 서버에서 도구 목록을 가져왔습니다.")
@@ -246,8 +525,9 @@ async def test_gemini_function_calling():
     print()
     
     # Gemini 모델 초기화
+    genai, google_exceptions = _get_genai()
     try:
-        model = GenerativeModel(
+        model = genai.GenerativeModel(
             model_name="gemini-2.0-flash-exp",
             tools=tools_to_use
         )
@@ -255,7 +535,7 @@ async def test_gemini_function_calling():
     except Exception as e:
         print(f"[WARNING] gemini-2.0-flash-exp 모델을 사용할 수 없습니다: {str(e)}")
         try:
-            model = GenerativeModel(
+            model = genai.GenerativeModel(
                 model_name="gemini-1.5-pro",
                 tools=tools_to_use
             )
@@ -273,120 +553,15 @@ async def test_gemini_function_calling():
         "근로기준법에 대해 알려줘"
     ]
     
-    for i, query in enumerate(test_queries, 1):
-        print(f"\n{'=' * 80}")
-        print(f"테스트 {i}: {query}")
-        print('=' * 80)
-        print()
-        
-        try:
-            # 채팅 시작
-            chat = model.start_chat()
-            
-            # 사용자 메시지 전송
-            print(f"[USER] 사용자: {query}")
-            print()
-            
-            response = chat.send_message(query)
-            
-            # 응답 처리
-            if hasattr(response, 'candidates') and response.candidates:
-                candidate = response.candidates[0]
-                
-                # Function Call이 있는지 확인
-                if hasattr(candidate, 'content') and candidate.content:
-                    parts = candidate.content.parts if hasattr(candidate.content, 'parts') else []
-                    
-                    function_calls = []
-                    for part in parts:
-                        if hasattr(part, 'function_call'):
-                            function_calls.append(part.function_call)
-                    
-                    if function_calls:
-                        print("[FUNCTION CALL] Function Calls 감지:")
-                        for fc in function_calls:
-                            # fc.args를 dict로 변환
-                            if hasattr(fc.args, 'items'):
-                                args_dict = dict(fc.args)
-                            elif hasattr(fc.args, '__dict__'):
-                                args_dict = fc.args.__dict__
-                            else:
-                                args_dict = {}
-                            
-                            print(f"   - {fc.name}({json.dumps(args_dict, ensure_ascii=False, indent=2)})")
-                        print()
-                        
-                        # Function Call 실행
-                        for fc in function_calls:
-                            tool_name = fc.name
-                            
-                            # tool_name이 비어있으면 건너뛰기
-                            if not tool_name:
-                                print(f"[WARNING] Function call name이 비어있습니다. 건너뜁니다.")
-                                continue
-                            
-                            # fc.args를 dict로 변환
-                            if hasattr(fc.args, 'items'):
-                                arguments = dict(fc.args)
-                            elif hasattr(fc.args, '__dict__'):
-                                arguments = fc.args.__dict__
-                            else:
-                                arguments = {}
-                            
-                            print(f"[CALL] MCP 도구 호출: {tool_name}")
-                            result = call_mcp_tool(tool_name, arguments)
-                            
-                            # 결과를 모델에 전달
-                            function_response = {
-                                "function_response": {
-                                    "name": tool_name,
-                                    "response": result
-                                }
-                            }
-                            
-                            print(f"[RESULT] 결과 수신 (요약): {str(result)[:200]}...")
-                            print()
-                            
-                            # Function Response를 모델에 전달
-                            response = chat.send_message(function_response)
-                    
-                    # 최종 응답 출력
-                    if hasattr(response, 'text'):
-                        print("[GEMINI] Gemini 응답:")
-                        print(response.text)
-                    elif hasattr(response, 'candidates') and response.candidates:
-                        candidate = response.candidates[0]
-                        if hasattr(candidate, 'content'):
-                            if hasattr(candidate.content, 'parts'):
-                                text_parts = [p.text for p in candidate.content.parts if hasattr(p, 'text')]
-                                if text_parts:
-                                    print("[GEMINI] Gemini 응답:")
-                                    print("\n".join(text_parts))
-                else:
-                    print("[GEMINI] Gemini 응답:")
-                    if hasattr(response, 'text'):
-                        print(response.text)
-                    else:
-                        print(str(response))
-            else:
-                print("[GEMINI] Gemini 응답:")
-                if hasattr(response, 'text'):
-                    print(response.text)
-                else:
-                    print(str(response))
-            
-            print()
-            time.sleep(1)  # API 호출 간격
-            
-        except google_exceptions.ResourceExhausted as e:
-            print(f"[ERROR] API 할당량 초과: {str(e)}")
-            print("   잠시 후 다시 시도해주세요.")
-            break
-        except Exception as e:
-            print(f"[ERROR] 오류 발생: {str(e)}")
-            import traceback
-            traceback.print_exc()
-        
+    # 쿼리별 채팅은 서로 독립적이므로 동시에 실행 (Gemini 요청 제한을 고려해 동시 실행 수 제한)
+    # 할당량 초과가 발생하면 TaskGroup이 아직 끝나지 않은 쿼리를 모두 취소
+    semaphore = asyncio.Semaphore(QUERY_CONCURRENCY)
+    try:
+        async with asyncio.TaskGroup() as group:
+            for i, query in enumerate(test_queries, 1):
+                group.create_task(_run_query(model, i, query, semaphore))
+    except* google_exceptions.ResourceExhausted:
+        print("[ERROR] API 할당량 초과로 남은 테스트를 중단했습니다.")
         print()
     
     print("=" * 80)
@@ -395,23 +570,11 @@ async def test_gemini_function_calling():
 
 
 if __name__ == "__main__":
-    # 서버가 실행 중인지 확인
-    import requests
-    try:
-        response = requests.get("http://localhost:8096/health", timeout=5)
-        if response.status_code == 200:
-            print("[OK] MCP 서버가 실행 중입니다.")
-        else:
-            print("[WARNING] MCP 서버 응답이 예상과 다릅니다.")
-    except Exception as e:
-        print("[ERROR] MCP 서버에 연결할 수 없습니다.")
-        print("   먼저 다음 명령으로 서버를 실행해주세요:")
-        print("   HTTP_MODE=1 python -m src.main")
-        print()
-        print("   또는 .env 파일에 HTTP_MODE=1 추가 후:")
-        print("   python -m src.main")
-        exit(1)
+    async def main():
+        try:
+            await test_gemini_function_calling()
+        finally:
+            _CLIENT.close()
+            await _ASYNC_CLIENT.aclose()
     
-    print()
-    asyncio.run(test_gemini_function_calling())
-
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+# test_cache.py
+"""
+cache.py 단위 테스트
+"""
+import asyncio
+
+from src.cache import CacheMux, async_cached, make_ttl_cache
+
+
+def test_make_ttl_cache_evicts_least_recently_used():
+    """가득 찬 캐시는 최근에 조회된 키를 남기고 가장 오래 사용되지 않은 키를 제거"""
+    cache = make_ttl_cache(2, 60)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+
+    cache["c"] = 3
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_lookup_order_hit_then_neg_then_inflight():
+    """성공 캐시 → 실패 캐시 → 진행 중 조회 순서로 확인"""
+    mux = CacheMux(make_ttl_cache(10, 60))
+    key = ("민법",)
+    assert mux.lookup(key) == ("miss", None)
+
+    task = object()
+    mux.inflight[key] = task
+    assert mux.lookup(key) == ("inflight", task)
+
+    mux.record_failure(key, {"error": "일시적 오류"})
+    assert mux.lookup(key) == ("neg", {"error": "일시적 오류"})
+
+    mux.record_success(key, {"total": 1})
+    assert mux.lookup(key) == ("hit", {"total": 1})
+
+
+async def test_concurrent_identical_calls_share_one_lookup():
+    """캐시 미스 상태에서 같은 키로 동시에 들어온 호출은 upstream을 한 번만 호출"""
+    mux = CacheMux(make_ttl_cache(10, 60))
+    calls = []
+
+    @async_cached(mux=mux, namespace="test", key=lambda query: (query,))
+    async def search(query):
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return {"query": query}
+
+    results = await asyncio.gather(*(search("민법") for _ in range(5)))
+
+    assert calls == ["민법"]
+    assert results == [{"query": "민법"}] * 5
+    assert mux.inflight == {}
+    assert mux.lookup(("민법",)) == ("hit", {"query": "민법"})
+
+
+async def test_inflight_followers_retry_uncached_errors():
+    """실패 캐시에 기록되지 않은 오류(인증 오류 등)는 대기 중인 호출자에게 공유하지 않음"""
+    mux = CacheMux(make_ttl_cache(10, 60))
+    calls = []
+
+    @async_cached(mux=mux, namespace="test", key=lambda query, api_key: (query,))
+    async def search(query, api_key):
+        calls.append(api_key)
+        await asyncio.sleep(0.01)
+        return {"error": "403"} if api_key == "wrong" else {"query": query}
+
+    results = await asyncio.gather(search("민법", "wrong"), search("민법", "valid"))
+
+    assert calls == ["wrong", "valid"]
+    assert results == [{"error": "403"}, {"query": "민법"}]
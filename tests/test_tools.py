@@ -0,0 +1,67 @@
+# test_tools.py
+"""
+tools.py 실패 분류 / 재시도 대기 시간 단위 테스트
+"""
+import httpx
+import pytest
+
+from src.cache import CacheMux, make_ttl_cache
+from src.tools import RETRY_BACKOFF_MAX, _record_failure, _retry_delay
+
+URL = "https://www.law.go.kr/DRF/lawSearch.do?target=law&OC=secretkey&query=민법"
+
+
+def _status_error(status: int, headers: dict = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", URL)
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"Client error '{status}' for url '{request.url}'",
+                                 request=request, response=response)
+
+
+def _record(exc):
+    mux = CacheMux(make_ttl_cache(10, 60))
+    result = _record_failure(mux, ("민법",), {"error": f"API 요청 실패: {exc}"}, exc)
+    return mux, result
+
+
+def test_not_found_is_permanent_failure():
+    mux, _ = _record(_status_error(404))
+    assert ("민법",) in mux.permanent
+    assert ("민법",) not in mux.transient
+
+
+@pytest.mark.parametrize("exc", [_status_error(503), httpx.ConnectTimeout("timeout"), None])
+def test_server_and_network_errors_are_transient(exc):
+    mux, _ = _record(exc)
+    assert ("민법",) in mux.transient
+    assert ("민법",) not in mux.permanent
+
+
+@pytest.mark.parametrize("status", [401, 403])
+def test_auth_errors_are_not_cached(status):
+    mux, _ = _record(_status_error(status))
+    assert not mux.has_failure(("민법",))
+
+
+def test_error_message_hides_api_key():
+    _, result = _record(_status_error(404))
+    assert "secretkey" not in result["error"]
+    assert "OC=***" in result["error"]
+
+
+def test_retry_delay_honours_retry_after():
+    response = httpx.Response(429, headers={"Retry-After": "3"})
+    assert _retry_delay(0, response) == 3.0
+
+
+def test_retry_delay_caps_retry_after():
+    response = httpx.Response(503, headers={"Retry-After": "120"})
+    assert _retry_delay(0, response) == RETRY_BACKOFF_MAX
+
+
+def test_retry_delay_falls_back_to_backoff():
+    response = httpx.Response(503)
+    for attempt in range(6):
+        delay = _retry_delay(attempt, response)
+        assert 0 < delay <= RETRY_BACKOFF_MAX
+    assert _retry_delay(0) <= 0.75  # 0.5초 ±50% 지터